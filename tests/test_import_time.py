@@ -0,0 +1,44 @@
+"""Guard the deferred imports in bek_funcs: the lightweight helpers must stay light.
+
+``from uvbekutils import clean_field`` resolves through the lazy package
+``__init__`` to ``bek_funcs``; that module must import pandas, numpy,
+openpyxl, loguru and Qt only inside the functions that use them.
+
+Run with ``python -m pytest tests``.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+HEAVY_MODULES = ("pandas", "numpy", "openpyxl", "loguru", "PySide6")
+MAX_IMPORT_SECONDS = 0.2  # measured ~0.05 s; ~0.5 s when bek_funcs imported pandas at the top
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+
+
+def test_light_helper_loads_no_heavy_modules():
+    code = ("import sys; from uvbekutils import clean_field; "
+            "assert 'uvbekutils.bek_funcs' in sys.modules; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    loaded = _run(code).stdout.strip()
+    assert loaded == "", f"from uvbekutils import clean_field pulled in {loaded}"
+
+
+def test_bek_funcs_import_time_is_capped():
+    # -X importtime lines: "import time: self [us] | cumulative | imported package".
+    # Import the module directly: the lazy __getattr__ loads it via importlib,
+    # which -X importtime does not report.
+    stderr = _run("import uvbekutils.bek_funcs").stderr
+    cumulative_us = None
+    for line in stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == "uvbekutils.bek_funcs":
+            cumulative_us = int(parts[1])
+    assert cumulative_us is not None, "no importtime line for uvbekutils.bek_funcs"
+    assert cumulative_us / 1e6 < MAX_IMPORT_SECONDS, \
+        f"import uvbekutils.bek_funcs took {cumulative_us / 1e6:.3f} s (cap {MAX_IMPORT_SECONDS} s)"
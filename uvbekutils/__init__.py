@@ -7,7 +7,9 @@ it PySide6 — which turns a plain terminal script into a macOS GUI app that tak
 a dock icon and steals keyboard focus from its own prompts.
 
 Only pyautobek and select_file need Qt; every other submodule is Qt-free. Loading
-lazily means Qt arrives only when a dialog is actually used.
+lazily means Qt arrives only when a dialog is actually used. The prompts inside
+helpers such as exit_yes go through `dialogs`, whose terminal and scripted
+backends (UVBEKUTILS_DIALOG_BACKEND) never load Qt at all.
 
 Usage is unchanged:
 
@@ -19,25 +21,49 @@ import importlib
 
 # public name -> submodule that defines it
 _LAZY = {
-    # these two import PySide6, so they load Qt when first touched
-    "alert":                    "pyautobek",
-    "confirm":                  "pyautobek",
+    # these go through the dialogs backend, so they load Qt only with the 'qt' backend
+    "alert":                    "dialogs",
+    "confirm":                  "dialogs",
+    "set_dialog_backend":       "dialogs",
+    "get_dialog_backend":       "dialogs",
+    "record_dialogs":           "dialogs",
+    "replay_dialogs":           "dialogs",
+    "stop_dialog_session":      "dialogs",
+    "submit_dialog":            "dialogs",
+    "process_dialog_requests":  "dialogs",
+    "wait_with_dialogs":        "dialogs",
+    "start_dialog_pump":        "dialogs",
+
+    # this imports PySide6, so it loads Qt when first touched
     "select_file":              "select_file",
 
     "list_pick":                "list_pick",
     "sumby_w_totals":           "sumby_w_totals",
+    "write_sumby_w_totals":     "sumby_w_totals",
     "select_from_list":         "select_from_list",
     "ColSpec":                  "standardize_columns",
     "standardize_columns":      "standardize_columns",
+    "standardize_and_union":    "standardize_columns",
+    "parse_style_specs":        "excel_styles",
+    "register_styles":          "excel_styles",
+    "apply_style":              "excel_styles",
+
+    "enable_instrumentation":   "instrument",
+    "disable_instrumentation":  "instrument",
+    "InstrumentCollector":      "instrument",
 
     "safe_str":                 "bek_funcs",
     "scroll_box":               "bek_funcs",
     "is_number":                "bek_funcs",
+    "is_number_series":         "bek_funcs",
     "exit_yes":                 "bek_funcs",
     "exit_yes_no":              "bek_funcs",
     "clean_field":              "bek_funcs",
     "autosize_xls_cols":        "bek_funcs",
+    "autosize_xls_cols_from_df": "bek_funcs",
+    "df_col_widths":            "bek_funcs",
     "load_workbook_w_filepath": "bek_funcs",
+    "clear_workbook_cache":     "bek_funcs",
     "wb_path":                  "bek_funcs",
     "wb_name":                  "bek_funcs",
     "setup_loguru":             "bek_funcs",
@@ -45,13 +71,18 @@ _LAZY = {
     "bad_path_exit":            "bek_funcs",
     "bad_path_create":          "bek_funcs",
     "calling_func":             "bek_funcs",
+    "caller_context":           "bek_funcs",
+    "CallerContext":            "bek_funcs",
     "find_header_row_in_file":  "bek_funcs",
     "read_file_to_df":          "bek_funcs",
     "check_ws_headers":         "bek_funcs",
     "convert_bool":             "bek_funcs",
+    "convert_bool_series":      "bek_funcs",
     "exe_file":                 "bek_funcs",
     "exe_path":                 "bek_funcs",
     "bek_write_excel":          "bek_funcs",
+    "bek_write_excel_sheets":   "bek_funcs",
+    "bek_write_excel_by_group": "bek_funcs",
     "bek_excel_titles":         "bek_funcs",
     "conc_addr":                "bek_funcs",
     "conc_addr_desc":           "bek_funcs",
@@ -17,17 +17,38 @@ To add to an environment, in terminal:
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import pandas as pd
-from loguru import logger
-from openpyxl.workbook import Workbook
-from openpyxl.worksheet.worksheet import Worksheet
+from .instrument import instrumented
+
+# pandas/numpy and openpyxl cost the better part of a second to import, so they
+# are only named here for annotations; each function imports what it uses.
+# That keeps `from uvbekutils import clean_field` fast for small CLI tools.
+if TYPE_CHECKING:
+    import pandas as pd
+    from loguru import logger
+    from openpyxl.workbook import Workbook
+    from openpyxl.worksheet.worksheet import Worksheet
 
 # TODO what to do with loggers?
 
 log_level = "DEBUG"  # used for log file; screen set to INFO. TRACE, DEBUG, INFO, WARNING, ERROR
 
+# load_workbook_w_filepath(cache=True): (path, mtime, size, options) -> (workbook, estimated bytes)
+_WB_CACHE: OrderedDict = OrderedDict()
+WB_CACHE_MAX_ITEMS = 8
+WB_CACHE_MAX_BYTES = 512 * 1024 * 1024
+_WB_MEMORY_FACTOR = 10  # rough in-memory size of a fully loaded workbook vs. its .xlsx size
+# openpyxl.load_workbook's parameters after filename, in positional order
+_LOAD_WORKBOOK_PARAMS = ('read_only', 'keep_vba', 'data_only', 'keep_links', 'rich_text')
+
+_WIDTH_CHUNK_ROWS = 50_000  # df_col_widths measures this many rows at a time, so memory stays flat
+
+_log_flush_registered = False  # setup_loguru(enqueue=True) registers logger.complete at exit once
+
 def safe_str(value: object) -> str:
     """Convert a value to string, returning empty string for NaN.
 
@@ -41,23 +62,117 @@ def safe_str(value: object) -> str:
     return '' if pd.isna(value) else str(value)
 
 
-def load_workbook_w_filepath(file: Path, *args, **kwargs) -> Workbook:
+def load_workbook_w_filepath(
+    file: Path,
+    *args,
+    read_only: bool = False,
+    data_only: bool = False,
+    cache: bool = False,
+    **kwargs,
+) -> Workbook:
     """Load an openpyxl workbook and attach the source path as a filepath attribute.
 
+    With cache=True the workbook is kept in a small process-level LRU cache
+    keyed by the resolved path, the file's mtime and size, and the load
+    options, so helpers that load the same config workbook in one run parse
+    it only once. A file that changes on disk is reloaded. Cached workbooks
+    are shared: a caller that edits one changes it for every later caller
+    until the file is saved. The cache holds at most WB_CACHE_MAX_ITEMS
+    workbooks and about WB_CACHE_MAX_BYTES of estimated memory, dropping the
+    least recently used first. Dropping never closes a workbook, so a
+    read-only workbook stays usable by whoever holds it; its file closes when
+    it is no longer referenced, or with clear_workbook_cache(close=True).
+
     Args:
         file: Path to the workbook file.
-        *args: Positional arguments passed to openpyxl.load_workbook.
+        *args: Positional arguments of openpyxl.load_workbook after the
+            filename (read_only, keep_vba, data_only, keep_links,
+            rich_text). They are treated as the same-named keywords, so
+            these calls are cached like keyword calls.
+        read_only: Open in openpyxl's read-only mode, which streams rows from
+            the file on access instead of building every cell and style.
+            Best for large workbooks that are only read.
+        data_only: Return cached formula results instead of formulas.
+        cache: Reuse a cached workbook for the same file and options.
         **kwargs: Keyword arguments passed to openpyxl.load_workbook.
 
     Returns:
         The loaded Workbook with a filepath attribute set to file.
     """
     from openpyxl import load_workbook
-    wb = load_workbook(file, *args, **kwargs)
+    from loguru import logger
+
+    if len(args) > len(_LOAD_WORKBOOK_PARAMS):
+        raise TypeError(f"load_workbook_w_filepath takes at most {len(_LOAD_WORKBOOK_PARAMS)} "
+                        f"positional arguments after file ({len(args)} given)")
+    for name, value in zip(_LOAD_WORKBOOK_PARAMS, args):
+        if name in kwargs:
+            raise TypeError(f"load_workbook_w_filepath got multiple values for argument '{name}'")
+        if name == 'read_only':
+            read_only = value
+        elif name == 'data_only':
+            data_only = value
+        else:
+            kwargs[name] = value
+
+    if not cache:
+        wb = load_workbook(file, read_only=read_only, data_only=data_only, **kwargs)
+        wb.filepath = file
+        return wb
+
+    stat = Path(file).expanduser().stat()
+    key = (str(Path(file).expanduser().resolve()), stat.st_mtime_ns, stat.st_size,
+           read_only, data_only, tuple(sorted(kwargs.items())))
+    if key in _WB_CACHE:
+        _WB_CACHE.move_to_end(key)
+        logger.debug(f"workbook cache hit for '{file}'")
+        return _WB_CACHE[key][0]
+
+    # the file changed since an earlier load with these options: that copy is stale
+    for stale in [k for k in _WB_CACHE if k[0] == key[0] and k[3:] == key[3:]]:
+        _evict_workbook(stale, _WB_CACHE.pop(stale))
+
+    wb = load_workbook(file, read_only=read_only, data_only=data_only, **kwargs)
     wb.filepath = file
+    # read-only workbooks keep little beyond the open file; full loads run
+    # several times the .xlsx size once every cell and style is built
+    est_bytes = stat.st_size * (1 if read_only else _WB_MEMORY_FACTOR)
+    _WB_CACHE[key] = (wb, est_bytes)
+    while len(_WB_CACHE) > 1 and (len(_WB_CACHE) > WB_CACHE_MAX_ITEMS or
+                                  sum(size for _, size in _WB_CACHE.values()) > WB_CACHE_MAX_BYTES):
+        _evict_workbook(*_WB_CACHE.popitem(last=False))
     return wb
 
 
+def _evict_workbook(key: tuple, entry: tuple) -> None:
+    """Drop the cache's reference to one workbook.
+
+    A read-only workbook is not closed: it was handed out shared, and a caller
+    may still be iterating it. Its file closes once the last holder lets go.
+    """
+
+    from loguru import logger
+
+    wb, est_bytes = entry
+    logger.debug(f"workbook cache evicted '{key[0]}' (~{est_bytes / 1e6:.0f} MB)")
+
+
+def clear_workbook_cache(close: bool = False) -> None:
+    """Empty the load_workbook_w_filepath cache.
+
+    Args:
+        close: Also close the cached read-only workbooks' files now, e.g. at
+            the end of a run. Only pass True when no caller still uses a
+            workbook it got from the cache.
+    """
+
+    while _WB_CACHE:
+        key, entry = _WB_CACHE.popitem(last=False)
+        if close and key[3]:  # read_only workbooks hold the file open
+            entry[0].close()
+        _evict_workbook(key, entry)
+
+
 def wb_path(wb: Workbook) -> Path | None:
     """Return the filepath attribute of a workbook, or None if not set.
 
@@ -100,6 +215,7 @@ def bek_excel_titles(
     cell_infos: list | None = None,
     auto_size_before: bool | None = None,
     auto_size_after: bool | None = None,
+    styles: dict[str, dict] | None = None,
 ) -> None:
     """Write formatted cell values and titles to sheets in an Excel workbook.
 
@@ -111,20 +227,25 @@ def bek_excel_titles(
         sheet_name_list: Sheet name or list of sheet names to add titles to.
             Pass True to apply to all sheets.
         cell_infos: List of cell-attribute dicts. Each dict specifies a cell
-            by 1-based row/col and a cell attribute to set. Use 'value' for
-            text and 'font' for a Font(...) expression string. Example::
+            by 1-based row/col, or several cells by an A1-style 'range', and a
+            cell attribute to set. Use 'value' for text, 'style' for the name
+            of a style in styles, and 'font' for a Font(...) expression string
+            (literal keyword arguments only). Example::
 
                 [
                     {'row': 1, 'col': 1, 'cell_attr': 'value', 'cell_value': 'Report'},
-                    {'row': 1, 'col': 1, 'cell_attr': 'font',  'cell_value': 'Font(b=True, size=20)'},
+                    {'row': 1, 'col': 1, 'cell_attr': 'style', 'cell_value': 'title'},
+                    {'range': 'A3:F3',   'cell_attr': 'font',  'cell_value': 'Font(b=True, size=12)'},
                 ]
 
         auto_size_before: If truthy, autosize all columns before writing cells.
         auto_size_after: If truthy, autosize all columns after writing cells.
+        styles: Named style specs (see uvbekutils.excel_styles), parsed once and
+            registered in wb so cell_infos can use them by name.
     """
 
-    from openpyxl.styles import Font
     from uvbekutils import autosize_xls_cols
+    from uvbekutils.excel_styles import register_styles
 
     if isinstance(sheet_name_list,str):
         sheet_name_list = [sheet_name_list]
@@ -137,72 +258,367 @@ def bek_excel_titles(
         for sh in wb.worksheets:
             autosize_xls_cols(sh)
 
+    if styles:
+        register_styles(wb, styles)
+
     # TODO perform checks on formats of cell_infos
     if cell_infos:
         for sh in wb.worksheets:
             if sh.title in sheet_name_list:
-                for cell_info in cell_infos:
-                    if cell_info['cell_attr'] == 'font':
-                        # use eval because needs to be like ft1 = Font(name='Arial', size=14).  might be able to use
-                        # another setattr but not ready to try now
-                        setattr(sh.cell(row=cell_info['row'], column=cell_info['col']), cell_info['cell_attr'],
-                                eval(cell_info['cell_value']))
-                    else:
-                        setattr(sh.cell(row=cell_info['row'], column=cell_info['col']), cell_info['cell_attr'],
-                                cell_info['cell_value'])
+                _apply_cell_infos(sh, cell_infos)
 
     if auto_size_after:
         for sh in wb.worksheets:
             autosize_xls_cols(sh)
 
 
+def _cell_info_value(cell_info: dict) -> object:
+    """Return the object a cell_infos entry assigns to its cell attribute."""
+
+    from uvbekutils.excel_styles import font_from_str
+
+    if cell_info['cell_attr'] == 'font':
+        return font_from_str(cell_info['cell_value'])
+    return cell_info['cell_value']
+
+
+def _cell_info_coords(cell_info: dict) -> list[tuple[int, int]]:
+    """Return the 1-based (row, col) cells a cell_infos entry targets."""
+
+    from openpyxl.utils.cell import range_boundaries
+
+    if 'range' in cell_info:
+        min_col, min_row, max_col, max_row = range_boundaries(cell_info['range'])
+        return [(row, col) for row in range(min_row, max_row + 1) for col in range(min_col, max_col + 1)]
+    return [(cell_info['row'], cell_info['col'])]
+
+
+def _apply_cell_infos(ws: Worksheet, cell_infos: list) -> None:
+    """Set every cell_infos entry on ws, building each value once per entry."""
+
+    for cell_info in cell_infos:
+        value = _cell_info_value(cell_info)
+        for row, col in _cell_info_coords(cell_info):
+            setattr(ws.cell(row=row, column=col), cell_info['cell_attr'], value)
+
+
+def _iter_df_rows(df: pd.DataFrame, index: bool = True, chunk_rows: int = 10_000):
+    """Yield the rows of df as lists of plain values, index levels first.
+
+    Missing values come back as None. Works a chunk at a time so only
+    chunk_rows rows are ever converted to Python objects at once.
+    """
+
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        values = chunk.astype(object).where(chunk.notna(), None).itertuples(index=False, name=None)
+        if index:
+            idx = chunk.index.to_frame(index=False)
+            idx_values = idx.astype(object).where(idx.notna(), None).itertuples(index=False, name=None)
+            for idx_row, row in zip(idx_values, values):
+                yield [*idx_row, *row]
+        else:
+            for row in values:
+                yield list(row)
+
+
+def _df_header_rows(df: pd.DataFrame, index: bool = True) -> list[list]:
+    """Return the header row(s) df.to_excel would write, one per column level."""
+
+    n_levels = df.columns.nlevels
+    rows = []
+    for level in range(n_levels):
+        labels = list(df.columns.get_level_values(level))
+        if index:
+            # like to_excel, index names sit on the last header row
+            names = list(df.index.names) if level == n_levels - 1 else [None] * df.index.nlevels
+            labels = names + labels
+        rows.append(labels)
+    return rows
+
+
+def _write_df_streaming(ws, df: pd.DataFrame, startrow: int, cell_infos: list | None = None,
+                        index: bool = True, widths: list[int] | None = None,
+                        row_styles: list[str | None] | None = None,
+                        row_outline_levels: list[int] | None = None,
+                        sample_rows: int | None = None) -> None:
+    """Write title cells, header and rows of df to a write-only worksheet in order.
+
+    Row layout matches df.to_excel(startrow=startrow): cell_infos entries on
+    rows 1..startrow become title cells, the header follows, then the data.
+    Entries that target the header or data are skipped with a warning,
+    since a write-only sheet cannot revisit rows already written.
+
+    row_styles and row_outline_levels, if given, run parallel to df's rows:
+    a named style (already registered in the workbook) for every cell of
+    that row, and the row's Excel outline (grouping) level. widths, if
+    not given, come from df_col_widths with sample_rows.
+    """
+
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    from openpyxl.utils import get_column_letter
+    from loguru import logger
+
+    # column widths must be set before the first row is appended
+    if widths is None:
+        widths = df_col_widths(df, index=index, sample_rows=sample_rows)
+    for offset, width in enumerate(widths):
+        ws.column_dimensions[get_column_letter(offset + 1)].width = width + 1
+
+    title_rows = {}
+    for cell_info in cell_infos or []:
+        value = _cell_info_value(cell_info)
+        for row_num, col_num in _cell_info_coords(cell_info):
+            if row_num > startrow:
+                logger.warning(f"streaming write skips cell_info below the title rows: {cell_info}")
+                break
+            title_rows.setdefault(row_num, {}).setdefault(col_num, []).append((cell_info['cell_attr'], value))
+
+    for row_num in range(1, startrow + 1):
+        row = []
+        for col_num, infos in sorted(title_rows.get(row_num, {}).items()):
+            row.extend([None] * (col_num - 1 - len(row)))
+            cell = WriteOnlyCell(ws)
+            for cell_attr, value in infos:
+                setattr(cell, cell_attr, value)
+            row.append(cell)
+        ws.append(row)
+
+    header_font = Font(bold=True)  # one shared style object for every header cell
+    header_rows = _df_header_rows(df, index=index)
+    for labels in header_rows:
+        row = []
+        for label in labels:
+            cell = WriteOnlyCell(ws, value=label)
+            cell.font = header_font
+            row.append(cell)
+        ws.append(row)
+
+    if row_styles is None and row_outline_levels is None:
+        for row in _iter_df_rows(df, index=index):
+            ws.append(row)
+        return
+
+    first_row = startrow + len(header_rows) + 1
+    for i, row in enumerate(_iter_df_rows(df, index=index)):
+        if row_outline_levels is not None and row_outline_levels[i]:
+            # row dimensions are read when the row is appended, so set them first
+            ws.row_dimensions[first_row + i].outlineLevel = row_outline_levels[i]
+        style = row_styles[i] if row_styles is not None else None
+        if style:
+            cells = []
+            for value in row:
+                cell = WriteOnlyCell(ws, value=value)
+                cell.style = style
+                cells.append(cell)
+            row = cells
+        ws.append(row)
+
+
+@instrumented
 def bek_write_excel(
     df: pd.DataFrame,
     sheet_name: str,
     startrow: int,
     cell_infos: list | None = None,
+    streaming: bool = False,
+    styles: dict[str, dict] | None = None,
+    sample_rows: int | None = None,
 ) -> None:
     """Write a DataFrame to an Excel file named after the running script.
 
     Autosizes columns before writing title cells to avoid '######'. The output
     file is placed in the same directory as the running executable.
 
+    With streaming=True the file is written through openpyxl's write-only
+    workbook: title cells, header and rows go out in order with precomputed
+    column widths, so memory stays flat however many rows df has. In that
+    mode cell_infos can only target title rows (row <= startrow), and a
+    MultiIndex is written one value per cell rather than as merged cells.
+
     Args:
         df: DataFrame to write to Excel.
         sheet_name: Name of the worksheet to write the DataFrame to.
         startrow: Row index (0-based) where the DataFrame header will be written.
         cell_infos: Optional list of cell-attribute dicts for formatting. See
             bek_excel_titles for format details.
+        streaming: If True, use the constant-memory write-only writer.
+        styles: Named style specs cell_infos can refer to. See bek_excel_titles.
+        sample_rows: Measure column widths from at most this many sampled
+            rows (see df_col_widths); None measures every row.
+    """
+
+    from uvbekutils import exe_file
+
+    bek_write_excel_sheets({sheet_name: df}, exe_file().with_suffix(".xlsx"), startrow,
+                           {sheet_name: cell_infos} if cell_infos else None, streaming=streaming,
+                           styles=styles, sample_rows=sample_rows)
+
+
+def bek_write_excel_sheets(
+    sheets: dict[str, pd.DataFrame],
+    op_file: Path,
+    startrow: int | dict[str, int] = 0,
+    cell_infos: dict[str, list] | None = None,
+    streaming: bool = False,
+    styles: dict[str, dict] | None = None,
+    sample_rows: int | None = None,
+) -> Path:
+    """Write several DataFrames, one per sheet, to one workbook in a single pass.
+
+    Each sheet is sized from its DataFrame and then gets its title cells, as in
+    bek_write_excel. styles are parsed and registered once for the whole
+    workbook, and fonts named in cell_infos are built once and shared by
+    every cell and sheet that uses them.
+
+    Args:
+        sheets: Sheet name -> DataFrame, in sheet order.
+        op_file: Output .xlsx path.
+        startrow: Row index (0-based) of the header, for all sheets or per
+            sheet name (missing names default to 0).
+        cell_infos: Sheet name -> list of cell-attribute dicts. See
+            bek_excel_titles for format details. Sheets not named get none.
+        streaming: If True, use the constant-memory write-only writer; see
+            bek_write_excel for its limits.
+        styles: Named style specs cell_infos can refer to. See bek_excel_titles.
+        sample_rows: Measure column widths from at most this many sampled
+            rows (see df_col_widths); None measures every row.
+
+    Returns:
+        op_file as a Path.
     """
 
     from pathlib import Path
     import pandas as pd
-    from openpyxl.styles import Font
-    from uvbekutils import autosize_xls_cols
-    from uvbekutils import exe_file
+    from openpyxl import Workbook
+    from uvbekutils import autosize_xls_cols_from_df
+    from uvbekutils.excel_styles import parse_style_specs, register_styles
 
-    op_file = exe_file().with_suffix(".xlsx")
+    op_file = Path(op_file)
+    named_styles = parse_style_specs(styles) if styles else {}
+    cell_infos = cell_infos or {}
+    startrows = startrow if isinstance(startrow, dict) else dict.fromkeys(sheets, startrow)
 
-    writer = pd.ExcelWriter(op_file)
+    if streaming:
+        wb = Workbook(write_only=True)
+        register_styles(wb, named_styles)
+        for sheet_name, df in sheets.items():
+            _write_df_streaming(wb.create_sheet(sheet_name), df, startrows.get(sheet_name, 0),
+                                cell_infos.get(sheet_name), sample_rows=sample_rows)
+        wb.save(op_file)
+        return op_file
 
-    df.to_excel(writer, sheet_name = sheet_name, startrow = startrow)
-    wb = writer.book
-    for sh in wb.worksheets:
-        autosize_xls_cols(sh)
+    with pd.ExcelWriter(op_file) as writer:
+        register_styles(writer.book, named_styles)
+        for sheet_name, df in sheets.items():
+            df.to_excel(writer, sheet_name=sheet_name, startrow=startrows.get(sheet_name, 0))
+            sh = writer.book[sheet_name]
+            autosize_xls_cols_from_df(sh, df, sample_rows=sample_rows)
+            _apply_cell_infos(sh, cell_infos.get(sheet_name) or [])
 
-    if cell_infos:
-        for sh in wb.worksheets:
-            for cell_info in cell_infos:
-                if cell_info['cell_attr'] == 'font':
-                    # use eval because needs to be like ft1 = Font(name='Arial', size=14).  might be able to use
-                    # another setattr but not ready to try now
-                    setattr(sh.cell(row=cell_info['row'], column=cell_info['col']), cell_info['cell_attr'],
-                            eval(cell_info['cell_value']))
-                else:
-                    setattr(sh.cell(row=cell_info['row'], column=cell_info['col']), cell_info['cell_attr'],
-                            cell_info['cell_value'])
+    return op_file
+
+
+def _group_cell_infos(cell_infos: list | None, group_label: str) -> list | None:
+    """Copy cell_infos with '{group}' in text values replaced by group_label."""
+
+    if not cell_infos:
+        return cell_infos
+    return [{**info, 'cell_value': info['cell_value'].replace('{group}', group_label)}
+            if info['cell_attr'] == 'value' and isinstance(info['cell_value'], str) else info
+            for info in cell_infos]
+
+
+def _write_group_workbook(task: tuple) -> dict:
+    """Process-pool worker for bek_write_excel_by_group: write one group's workbook."""
+
+    import time
+
+    group, df, op_file, sheet_name, startrow, cell_infos, styles, streaming = task
+    start = time.perf_counter()
+    bek_write_excel_sheets({sheet_name: df}, op_file, startrow,
+                           {sheet_name: cell_infos} if cell_infos else None,
+                           streaming=streaming, styles=styles)
+    return {'group': group, 'path': op_file, 'rows': len(df), 'seconds': time.perf_counter() - start}
+
+
+def bek_write_excel_by_group(
+    df: pd.DataFrame,
+    by: str | list[str],
+    op_dir: Path,
+    sheet_name: str = "Sheet1",
+    startrow: int = 0,
+    cell_infos: list | None = None,
+    styles: dict[str, dict] | None = None,
+    file_name: str = "{group}.xlsx",
+    streaming: bool = False,
+    max_workers: int | None = None,
+) -> list[dict]:
+    """Write one workbook per group of df, in parallel worker processes.
+
+    df is grouped once; each group's workbook is then written by
+    bek_write_excel_sheets in a process pool, all sharing the same title
+    cells and style specs. In cell_infos text values and in file_name,
+    '{group}' is replaced by the group's label (multi-column keys are joined
+    with ' - '; characters not allowed in file names become '_'). Labels that
+    end up with the same file name (e.g. 'A/B' and 'A_B', or names differing
+    only in case) get ' (2)', ' (3)', ... added so no workbook overwrites
+    another.
+
+    Args:
+        df: Source DataFrame.
+        by: Column name(s) to group on, e.g. 'Factory'.
+        op_dir: Directory for the workbooks; created if missing.
+        sheet_name: Worksheet name in every workbook.
+        startrow: Row index (0-based) of the header in every workbook.
+        cell_infos: Title cell-attribute dicts shared by all workbooks. See
+            bek_excel_titles for format details.
+        styles: Named style specs shared by all workbooks.
+        file_name: File name pattern for each workbook.
+        streaming: If True, use the constant-memory write-only writer.
+        max_workers: Process count; None lets the pool decide, 1 writes in
+            this process without a pool.
+
+    Returns:
+        Manifest in group order: one dict per workbook with 'group',
+        'path', 'rows' and 'seconds' (time spent writing it).
+    """
+
+    import re
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+    from pathlib import Path
+    from loguru import logger
+
+    op_dir = Path(op_dir).expanduser()
+    op_dir.mkdir(parents=True, exist_ok=True)
+
+    tasks = []
+    used_names = set()  # lowercased: macOS and Windows file names are case-insensitive
+    for key, group_df in df.groupby(by, sort=False, dropna=False):
+        label = " - ".join(str(k) for k in key) if isinstance(key, tuple) else str(key)
+        safe_label = re.sub(r'[\\/:*?"<>|]', '_', label)
+        op_file = base = op_dir / file_name.replace('{group}', safe_label)
+        n = 1
+        while op_file.name.lower() in used_names:
+            n += 1
+            op_file = base.with_name(f"{base.stem} ({n}){base.suffix}")
+        if n > 1:
+            logger.warning(f"group '{label}' would share a file name with another group; writing '{op_file.name}'")
+        used_names.add(op_file.name.lower())
+        tasks.append((key, group_df, op_file, sheet_name,
+                      startrow, _group_cell_infos(cell_infos, label), styles, streaming))
+
+    start = time.perf_counter()
+    if max_workers == 1:
+        manifest = [_write_group_workbook(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            manifest = list(pool.map(_write_group_workbook, tasks))
+    logger.info(f"wrote {len(manifest)} workbooks to '{op_dir}' in {time.perf_counter() - start:.1f}s")
+    return manifest
 
-    writer.close()
 
 def exe_file() -> Path:
     """Return the Path of the currently running script or frozen executable.
@@ -259,11 +675,16 @@ def setup_loguru(
     log_path: Path | None = None,
     log_mode: str = 'w',
     log_file: bool = True,
+    enqueue: bool = False,
+    rotation: str | int | None = None,
+    retention: str | int | None = None,
+    compression: str | None = None,
+    serialize: bool = False,
 ) -> logger:
     """Configure and return a loguru logger with stdout and optional file sinks.
 
-    Log file is placed in the same directory as the running executable. Any
-    existing log file is removed before a new one is opened.
+    Log file is placed in the same directory as the running executable. Unless
+    rotation is set, any existing log file is removed before a new one is opened.
 
     Args:
         log_level_std: Minimum log level for stdout output (e.g. 'INFO', 'DEBUG').
@@ -271,16 +692,29 @@ def setup_loguru(
         log_path: Directory for the log file. Defaults to exe_path() if None.
         log_mode: File open mode for the log file ('w' to overwrite, 'a' to append).
         log_file: If True, create a log file sink in addition to stdout.
+        enqueue: If True, file writes go through a queue to a background
+            thread, so logging calls return without waiting on disk I/O.
+            Queued messages are flushed at exit.
+        rotation: Start a new log file when this is reached: a size
+            ('50 MB'), an interval ('1 day', '1 week') or a time ('00:00').
+            Previous logs are kept and the file is opened for append.
+        retention: With rotation, how many old logs to keep (e.g. 10) or for
+            how long (e.g. '30 days'). Defaults to keeping all.
+        compression: With rotation, archive format for old logs ('zip', 'gz').
+        serialize: If True, write each record to the file as one JSON object
+            per line (JSON Lines) instead of formatted text.
 
     Returns:
         The configured loguru logger instance.
     """
 
-    # TODO suppress error if log not found which happens on first run
     # TODO do not create lof if log level is blank
 
+    global _log_flush_registered
+
     from pathlib import Path
     from loguru import logger
+    import atexit
     import os
     import sys
     from uvbekutils import exe_path
@@ -312,14 +746,21 @@ def setup_loguru(
 
     if log_file:
         logfile = exe_file().with_suffix(".log")
-        try:
-            os.remove(logfile)
-        except Exception as e:
-            logger.exception(e)
-            pass
+        if rotation is None:
+            try:
+                os.remove(logfile)
+            except FileNotFoundError:
+                pass  # first run - no previous log
+        else:
+            log_mode = 'a'  # rotation keeps earlier logs, so never truncate on start
 
         logger.trace("setting log_file info - adding logfile")
-        logger.add(open(logfile, log_mode), level=log_level_log, backtrace=True, diagnose=False)
+        logger.add(logfile, mode=log_mode, level=log_level_log, backtrace=True, diagnose=False,
+                   enqueue=enqueue, rotation=rotation, retention=retention, compression=compression,
+                   serialize=serialize)
+        if enqueue and not _log_flush_registered:
+            atexit.register(logger.complete)
+            _log_flush_registered = True
 
     return logger
 
@@ -327,26 +768,30 @@ def setup_loguru(
 def exit_yes_no(msg: str, title: str | None = None, display_exiting: bool = False) -> None:
     """Display a Yes/No prompt and exit the program if the user chooses No.
 
+    The prompt goes through the uvbekutils.dialogs backend (Qt, terminal or scripted).
+
     Args:
         msg: Message text to display in the dialog.
         title: Optional dialog window title.
         display_exiting: If True, show an 'Exiting' alert before exiting.
     """
 
-    from uvbekutils import pyautobek
+    from uvbekutils import dialogs
     from loguru import logger
 
-    choice = pyautobek.confirm(msg, title, buttons=['Continue', 'Exit'])
+    choice = dialogs.confirm(msg, title, buttons=['Continue', 'Exit'])
     if choice == "exit":
         if display_exiting:
-            pyautobek.alert("Exiting", "Alert")
-        logger.debug("here")
+            dialogs.alert("Exiting", "Alert")
+        logger.debug(f"exiting from exit_yes_no called from {caller_context()}")
         exit()
 
 
 def exit_yes(msg: str, title: str | None = None, *, errmsg: str | None = None, raise_err: bool = False) -> None:
     """Display an alert popup and then exit or raise an exception.
 
+    The alert goes through the uvbekutils.dialogs backend (Qt, terminal or scripted).
+
     Args:
         msg: Message text displayed in the popup.
         title: Optional dialog window title. Defaults to '** Exiting Program **'.
@@ -355,15 +800,15 @@ def exit_yes(msg: str, title: str | None = None, *, errmsg: str | None = None, r
         raise_err: If True, raise an Exception instead of calling exit().
     """
 
-    from uvbekutils import pyautobek
+    from uvbekutils import dialogs
     from loguru import logger
 
     if not errmsg:
         errmsg = msg.replace("\n", " ")  # dont fill the console with linefeeds
     if not title:
         title = "** Exiting Program **"
-    logger.debug("in 'exit_yes'")
-    pyautobek.alert(msg, title)
+    logger.debug(f"in 'exit_yes' called from {caller_context()}")
+    dialogs.alert(msg, title)
     if raise_err:
         logger.debug("ready to raise error'")
         raise Exception(errmsg)
@@ -385,19 +830,17 @@ def is_number(s: str) -> bool:
         True if s can be converted to float and is not NaN, False otherwise.
     """
 
-    import numpy as np
-    from loguru import logger
-
-    logger.trace("in is_number")
-
-    try:
-        if np.isnan(s):  # this is needed- np.nan are int which are numbers
-        # if s == np.nan:  # this is needed- np.nan are int which are numbers
-            return False
-    except TypeError:
-        pass
+    # Runs once per cell, so no logging here and strings skip np.isnan, which
+    # can only raise TypeError for them (raising costs more than the check)
     if s is None:
         return False
+    if not isinstance(s, str):
+        import numpy as np
+        try:
+            if np.isnan(s):  # this is needed- np.nan are int which are numbers
+                return False
+        except TypeError:
+            pass
     try:
         float(s)
         return True
@@ -405,6 +848,44 @@ def is_number(s: str) -> bool:
         return False
 
 
+def is_number_series(s: pd.Series) -> pd.Series:
+    """Vectorized is_number for a whole column.
+
+    Same answers as ``s.apply(is_number)`` - None and NaN are False, numbers
+    and numeric strings (surrounding spaces allowed, 'nan'/'inf' included)
+    are True - but computed with pandas operations on the column's distinct
+    values, then broadcast back with the factorize codes. Digit-group
+    underscores ('1_000'), which float() accepts, are not treated as numbers.
+
+    Args:
+        s: Column to test.
+
+    Returns:
+        Boolean Series aligned with s.
+    """
+
+    import numpy as np
+    import pandas as pd
+
+    if pd.api.types.is_bool_dtype(s) or pd.api.types.is_numeric_dtype(s):
+        return s.notna().astype(bool)
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        codes, uniques = s.cat.codes.to_numpy(), s.cat.categories
+    elif pd.api.types.is_object_dtype(s) or pd.api.types.is_string_dtype(s):
+        codes, uniques = pd.factorize(s)
+    else:
+        return pd.Series(False, index=s.index)
+
+    uniques = pd.Series(np.asarray(uniques, dtype=object))
+    text = uniques.str.strip()  # missing for non-string values
+    is_num = pd.to_numeric(text, errors='coerce').notna().to_numpy(copy=True)
+    is_num |= text.str.lower().isin(['nan', '+nan', '-nan']).to_numpy(dtype=bool)
+    non_str = text.isna().to_numpy()
+    if non_str.any():
+        is_num[non_str] = pd.to_numeric(uniques[non_str], errors='coerce').notna().to_numpy()
+    return pd.Series(np.where(codes >= 0, is_num[codes], False), index=s.index)
+
+
 def clean_field(fld: str, case_convert: str = 'lower') -> str:
     """Normalize a string by stripping whitespace and removing special characters.
 
@@ -422,8 +903,6 @@ def clean_field(fld: str, case_convert: str = 'lower') -> str:
 
     #TODO: pass characters to be removed as string
 
-    from loguru import logger
-
     return_fld = str(fld).strip().replace(" ", "").replace("'", "").replace(".", "").replace("-", "")
     if case_convert == 'lower':
         return_fld = return_fld.lower()
@@ -436,6 +915,7 @@ def clean_field(fld: str, case_convert: str = 'lower') -> str:
     return return_fld
 
 
+@instrumented
 def autosize_xls_cols(ws: Worksheet) -> None:
     """Auto-fit column widths in an openpyxl worksheet to their content.
 
@@ -446,8 +926,6 @@ def autosize_xls_cols(ws: Worksheet) -> None:
         ws: The openpyxl Worksheet to resize.
     """
 
-    from loguru import logger
-
     dims = {}
     for row in ws.rows:
         for cell in row:
@@ -462,6 +940,74 @@ def autosize_xls_cols(ws: Worksheet) -> None:
         ws.column_dimensions[col].width = value + 1
 
 
+def df_col_widths(df: pd.DataFrame, index: bool = True, sample_rows: int | None = None) -> list[int]:
+    """Compute Excel column widths for a DataFrame from its values, not its cells.
+
+    Uses vectorized string-length maxima per column instead of visiting
+    every worksheet cell. Rows are measured _WIDTH_CHUNK_ROWS at a time, so
+    the temporary string copies stay the same size however long df is.
+    Widths follow autosize_xls_cols: datetimes count as 10, missing values
+    are ignored, and header/index names are included.
+
+    Args:
+        df: DataFrame that is (or will be) written with df.to_excel.
+        index: True if the index is written too; its levels come first.
+        sample_rows: If set and df is longer, measure only this many randomly
+            sampled rows (fixed seed, so widths are repeatable).
+
+    Returns:
+        Widths in written column order: index levels (if index) then columns.
+    """
+
+    import pandas as pd
+
+    if sample_rows is not None and len(df) > sample_rows:
+        df = df.sample(n=sample_rows, random_state=0)
+
+    def _max_len(values: pd.Series | pd.Index, header: object) -> int:
+        header_parts = header if isinstance(header, tuple) else (header,)
+        width = max((len(str(h)) for h in header_parts if h is not None), default=0)
+        if pd.api.types.is_datetime64_any_dtype(values.dtype):
+            return max(width, 10)
+        for start in range(0, len(values), _WIDTH_CHUNK_ROWS):
+            # slice an Index before wrapping it; a Series over a RangeIndex materializes it whole
+            chunk = (pd.Series(values[start:start + _WIDTH_CHUNK_ROWS]) if isinstance(values, pd.Index)
+                     else values.iloc[start:start + _WIDTH_CHUNK_ROWS])
+            lengths = chunk[chunk.notna().to_numpy()].astype(str).str.len()
+            if len(lengths):
+                width = max(width, int(lengths.max()))
+        return width
+
+    widths = []
+    if index:
+        for level, name in enumerate(df.index.names):
+            widths.append(_max_len(df.index.get_level_values(level), name))
+    for pos, col in enumerate(df.columns):
+        widths.append(_max_len(df.iloc[:, pos], col))
+    return widths
+
+
+def autosize_xls_cols_from_df(ws: Worksheet, df: pd.DataFrame, index: bool = True,
+                              sample_rows: int | None = None, start_col: int = 1) -> None:
+    """Set worksheet column widths from the DataFrame written to it.
+
+    Faster replacement for autosize_xls_cols on sheets written with
+    df.to_excel: widths come from df_col_widths and are set once per column.
+
+    Args:
+        ws: The openpyxl Worksheet to resize.
+        df: DataFrame written to ws.
+        index: True if the index was written with the data.
+        sample_rows: Row-sampling cap passed to df_col_widths.
+        start_col: 1-based worksheet column of the first written column.
+    """
+
+    from openpyxl.utils import get_column_letter
+
+    for offset, width in enumerate(df_col_widths(df, index=index, sample_rows=sample_rows)):
+        ws.column_dimensions[get_column_letter(start_col + offset)].width = width + 1
+
+
 def bad_file_exit(file: Path, msg: str | None = None, raise_err: bool = False) -> None:
     """Exit or raise an error if the given file does not exist.
 
@@ -477,7 +1023,7 @@ def bad_file_exit(file: Path, msg: str | None = None, raise_err: bool = False) -
     if msg is None:
         msg = f"File:\n\n'{file}'\n\ndoes not exist."
     if not file.expanduser().exists():
-        logger.debug("here")
+        logger.debug(f"bad_file_exit called from {caller_context()}")
         exit_yes(msg, raise_err=raise_err)
 
 
@@ -496,7 +1042,7 @@ def bad_path_exit(path: Path, msg: str | None = None, raise_err: bool = False) -
     if msg is None:
         msg = f"Directory:\n\n'{path}'\n\ndoes not exist."
     if not path.expanduser().exists():
-        logger.debug("here")
+        logger.debug(f"bad_path_exit called from {caller_context()}")
         exit_yes(msg, raise_err=raise_err)
 
 
@@ -510,18 +1056,54 @@ def bad_path_create(path: Path, msg: str | None = None) -> None:
     """
 
     import os
-    from uvbekutils import pyautobek
+    from uvbekutils import dialogs
     from loguru import logger
 
     if msg is None:
         msg = ("Directory:\n\n" + str(path) + "\n\ndoes not exist.  Creating." +
                "\n\nCalled from " + calling_func(level=2))
     if not os.path.isdir(path):
-        logger.debug("here")
-        pyautobek.alert(msg, "Adding Directory via bad_path_create")
+        logger.debug(f"bad_path_create called from {caller_context()}")
+        dialogs.alert(msg, "Adding Directory via bad_path_create")
         os.makedirs(path)
 
 
+@dataclass(frozen=True)
+class CallerContext:
+    """Function name, file and line of one frame in the call stack."""
+
+    function: str
+    filename: str
+    lineno: int
+
+    def __str__(self) -> str:
+        return f"'{self.function}', line #: {self.lineno}"
+
+
+def caller_context(level: int = 1) -> CallerContext | None:
+    """Return where the function calling caller_context was itself called from.
+
+    Reads the one requested frame with sys._getframe; unlike inspect.stack()
+    it does not build every frame or load source lines, so it is cheap
+    enough to attach to log messages and alerts.
+
+    Args:
+        level: 0 is the function calling caller_context, 1 is its caller
+            (default), 2 the caller's caller, etc.
+
+    Returns:
+        A CallerContext, or None if the stack is not that deep.
+    """
+
+    import sys
+
+    try:
+        frame = sys._getframe(level + 1)
+    except ValueError:
+        return None
+    return CallerContext(frame.f_code.co_name, frame.f_code.co_filename, frame.f_lineno)
+
+
 def calling_func(level: int = 0) -> str:
     """Return the name and line number of a function in the call stack.
 
@@ -534,17 +1116,19 @@ def calling_func(level: int = 0) -> str:
         description if the stack level is too deep.
     """
 
-    import inspect
+    import sys
     from loguru import logger
 
     try:
-        func = f"'{inspect.stack()[level][3]}', line #: {inspect.stack()[level][2]}"
-    except Exception as e:
+        frame = sys._getframe(level)
+        func = f"'{frame.f_code.co_name}', line #: {frame.f_lineno}"
+    except ValueError as e:
         logger.exception(e)
-        func = f"** error ** inspect level too deep: {str(level)} called from {inspect.stack()[level][3]}"
+        func = f"** error ** inspect level too deep: {str(level)} called from {sys._getframe(1).f_code.co_name}"
     return func
 
 
+@instrumented
 def read_file_to_df(file_with_path: Path, **param_dict) -> pd.DataFrame | None:
     """Read an xlsx or csv file into a DataFrame, filtering kwargs by file type.
 
@@ -841,6 +1425,86 @@ def convert_bool(bool_val: bool | str | None) -> bool:
     return return_val
 
 
+def convert_bool_series(
+    s: pd.Series,
+    true_values: tuple[str, ...] = ('true',),
+    false_values: tuple[str, ...] = ('false',),
+    errors: str = 'raise',
+) -> pd.Series:
+    """Vectorized convert_bool for a whole column, returning nullable booleans.
+
+    Values are matched case-insensitively, ignoring surrounding spaces,
+    against true_values/false_values; pass e.g. ``('yes', 'y', '1')`` and
+    ``('no', 'n', '0')`` to accept more tokens. Python/numpy booleans match
+    'true'/'false' and whole-number floats match '1'/'0'. Missing values
+    stay <NA> and are not counted as invalid.
+
+    Args:
+        s: Column to convert.
+        true_values: Tokens meaning True.
+        false_values: Tokens meaning False.
+        errors: 'raise' to raise ValueError if any value is unrecognized,
+            'coerce' to set those values to <NA>.
+
+    Returns:
+        Series of dtype 'boolean' aligned with s. Its
+        ``attrs['invalid_positions']`` lists the 0-based positions of
+        unrecognized values.
+
+    Raises:
+        ValueError: If errors is not 'raise' or 'coerce', or if
+            errors='raise' and a value is not in either token set.
+    """
+
+    import numpy as np
+    import pandas as pd
+
+    if errors not in ('raise', 'coerce'):
+        raise ValueError(f"errors must be 'raise' or 'coerce', got {errors!r}")
+
+    # keys to factorize: whole floats as ints (1.0 -> 1, so it can match '1') and
+    # bools as 'true'/'false' - factorize would otherwise merge True, 1 and 1.0,
+    # which hash equal, under whichever of them came first
+    keys = s
+    if pd.api.types.is_float_dtype(s):
+        whole = (s % 1 == 0).to_numpy(dtype=bool, na_value=False)
+        if (whole | s.isna().to_numpy()).all():
+            keys = s.astype('Int64')
+        else:
+            keys = s.to_numpy(dtype=object, na_value=None)
+            keys[whole] = s[whole].astype('int64').tolist()  # non-whole floats can't match anyway
+    elif s.dtype == object:
+        types = s.map(type)
+        is_bool = types.isin((bool, np.bool_)).to_numpy()
+        is_float = types.isin((float, np.float16, np.float32, np.float64)).to_numpy()
+        if is_bool.any() or is_float.any():
+            keys = s.to_numpy(dtype=object, copy=True)
+            keys[is_bool] = np.where(keys[is_bool].astype(bool), 'true', 'false')
+            floats = keys[is_float].astype(float)
+            whole = np.flatnonzero(is_float)[floats % 1 == 0]
+            keys[whole] = floats[floats % 1 == 0].astype('int64').tolist()
+
+    # match each distinct value once, then broadcast with the factorize codes
+    codes, uniques = pd.factorize(keys)
+    tokens = pd.Series(np.asarray(uniques, dtype=object)).astype('string').str.strip().str.lower()
+    # a trailing False is what code -1 (missing) picks up, even when every value is missing
+    u_true = np.append(tokens.isin([t.lower() for t in true_values]).to_numpy(dtype=bool), False)
+    u_false = np.append(tokens.isin([f.lower() for f in false_values]).to_numpy(dtype=bool), False)
+    is_true = u_true[codes]
+    is_false = u_false[codes]
+
+    out = pd.Series(pd.NA, index=s.index, dtype='boolean')
+    out[is_true] = True
+    out[is_false] = False
+    invalid = (s.notna().to_numpy() & ~is_true & ~is_false).nonzero()[0].tolist()
+    out.attrs['invalid_positions'] = invalid
+
+    if invalid and errors == 'raise':
+        raise ValueError(f"{len(invalid)} value(s) not in {list(true_values)} / {list(false_values)}, "
+                         f"first at positions {invalid[:10]}: {s.iloc[invalid[:5]].tolist()}")
+    return out
+
+
 def conc_addr(concentration_dict: dict, state: str | None = None, city: str | None = None, address: str | None = None) -> bool:
     """Check whether a state/city/address combination is in the concentration dictionary.
 
@@ -915,25 +1579,37 @@ def conc_addr_remove_desc(concentration_dict: dict, state: str | None = None, ci
     return desc
 
 
-def scroll_box(txt: str, *, title: str | None = None, wrap_lines: bool = True,
-               width: int = 600, height: int = 400) -> None:
+def scroll_box(txt: str | None = None, *, title: str | None = None, wrap_lines: bool = True,
+               width: int = 600, height: int = 400, path: str | Path | None = None,
+               follow: bool = False) -> None:
   """Display a read-only scrollable text box using a PySide6 Qt window.
 
   Reuses an existing QApplication if one is already running, otherwise
   creates a new one and blocks until the window is closed.
 
+  Pass path instead of txt to view a file of any size, e.g. a log from
+  setup_loguru: the file is memory-mapped and only the lines on screen are
+  read (see text_viewer), with a search box and a Follow option that tracks
+  lines appended while the window is open.
+
   Args:
       txt: Text content to display.
       title: Window title bar text.
       wrap_lines: If True, wrap long lines to the window width. If False,
-          enable a horizontal scrollbar instead.
+          enable a horizontal scrollbar instead. Ignored with path; file
+          lines are never wrapped.
       width: Initial window width in pixels. Defaults to 600.
       height: Initial window height in pixels. Defaults to 400.
+      path: File to show in the streaming viewer instead of txt.
+      follow: With path, start at the end of the file and follow new lines.
   """
 
   from PySide6.QtWidgets import QApplication, QMainWindow, QTextEdit
   import sys
 
+  if (txt is None) == (path is None):
+      raise ValueError("scroll_box needs exactly one of txt or path")
+
   # Reuse existing QApplication if one exists, otherwise create new one
   app = QApplication.instance()
   app_created = False
@@ -941,6 +1617,17 @@ def scroll_box(txt: str, *, title: str | None = None, wrap_lines: bool = True,
       app = QApplication(sys.argv)
       app_created = True
 
+  if path is not None:
+      from uvbekutils.text_viewer import TextFileViewer
+
+      window = TextFileViewer(path, title=title, follow=follow, width=width, height=height)
+      window.show()
+      if app_created:
+          sys.exit(app.exec())
+      else:
+          app.exec()
+      return
+
   # Create main window with title
   window = QMainWindow()
   window.setWindowTitle(title)
@@ -0,0 +1,417 @@
+"""Pluggable backend for the prompts uvbekutils shows.
+
+``exit_yes``, ``exit_yes_no``, ``bad_path_create`` and
+``standardize_columns(popup=True)`` all prompt through ``alert`` and
+``confirm`` here, which hand off to the selected backend:
+
+* ``'qt'``       — PySide6 dialogs from ``pyautobek`` (default). Qt is only
+  imported when the first prompt is shown.
+* ``'terminal'`` — prints the message and reads the answer from stdin.
+  Never imports Qt.
+* ``'scripted'`` — answers instantly without any UI: alerts are logged,
+  confirms return a scripted answer (matched on title, then message) or
+  the first button. For unattended batch runs.
+
+Select with the ``UVBEKUTILS_DIALOG_BACKEND`` environment variable or in code::
+
+    from uvbekutils import set_dialog_backend
+
+    set_dialog_backend('scripted', answers={'Confirm Upload': 'no'})
+
+Answers to ``confirm``, ``list_pick`` and ``select_file`` can be recorded to
+a session file and replayed on later runs without building any widgets::
+
+    record_dialogs("~/run_answers.jsonl")     # or UVBEKUTILS_DIALOG_RECORD=path
+    replay_dialogs("~/run_answers.jsonl")     # or UVBEKUTILS_DIALOG_REPLAY=path
+
+The file holds one JSON object per answer. On replay, answers are matched
+by prompt kind and title and handed out in recorded order, so a prompt
+whose message changes between runs (dates, counts) still replays. A prompt
+with no recorded answer left is shown normally, or raises with strict=True.
+
+Prompts are thread-safe. Called from a worker thread, the ``pyautobek``
+dialogs (and so ``alert``/``confirm`` with the 'qt' backend), ``list_pick``
+and ``select_file`` queue the request for the main thread and block only
+the calling worker until it is answered; ``submit_dialog`` queues one
+without blocking and returns a Future. The 'terminal' and 'scripted'
+backends need no GUI thread and answer on the calling thread. The main
+thread answers queued prompts while it waits::
+
+    with ThreadPoolExecutor() as pool:
+        futures = [pool.submit(process_file, f) for f in files]
+        wait_with_dialogs(futures)      # not pool.shutdown()/f.result(): they would never show a prompt
+
+or, inside a running Qt application, after ``start_dialog_pump()``.
+
+Functions:
+    alert: Show a message with an Ok button.
+    confirm: Show a message with buttons; return the lowercase button text.
+    set_dialog_backend: Choose the backend (and scripted answers).
+    get_dialog_backend: Return the backend in use.
+    record_dialogs: Record every answer to a new session file.
+    replay_dialogs: Answer prompts from a session file.
+    stop_dialog_session: Stop recording and replaying.
+    submit_dialog: Queue a prompt for the main thread; return a Future.
+    process_dialog_requests: Answer queued prompts on the main thread.
+    wait_with_dialogs: Wait for futures while answering queued prompts.
+    start_dialog_pump: Answer queued prompts from a Qt timer.
+    gui_thread: Decorator routing a prompt function to the main thread.
+"""
+
+import functools
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import wait as futures_wait
+from pathlib import Path
+
+DEFAULT_BUTTONS = ["Ok", "Cancel"]
+
+
+class QtDialogs:
+    """Backend using the PySide6 dialogs in pyautobek."""
+
+    name = 'qt'
+
+    def alert(self, msg: str, title: str) -> None:
+        from uvbekutils import pyautobek
+        pyautobek.alert(msg, title)
+
+    def confirm(self, msg: str, title: str, buttons: list[str]) -> str:
+        from uvbekutils import pyautobek
+        return pyautobek.confirm(msg, title, buttons)
+
+
+class TerminalDialogs:
+    """Backend that prompts on stdout/stdin."""
+
+    name = 'terminal'
+
+    def alert(self, msg: str, title: str) -> None:
+        print(f"\n== {title} ==\n{msg}")
+        try:
+            input("[Enter] to continue ")
+        except EOFError:
+            pass  # no stdin (e.g. piped run) - nothing to wait for
+
+    def confirm(self, msg: str, title: str, buttons: list[str]) -> str:
+        print(f"\n== {title} ==\n{msg}")
+        choices = "  ".join(f"[{i}] {b}" for i, b in enumerate(buttons, start=1))
+        while True:
+            try:
+                answer = input(f"{choices}\n> ").strip()
+            except EOFError:
+                return ""  # same as closing the Qt dialog without choosing
+            if answer.isdigit() and 1 <= int(answer) <= len(buttons):
+                return buttons[int(answer) - 1].lower()
+            for button in buttons:
+                if answer.lower() == button.lower():
+                    return button.lower()
+            print(f"'{answer}' is not one of the choices.")
+
+
+class ScriptedDialogs:
+    """Backend that answers without any UI, for unattended runs.
+
+    Args:
+        answers: Title or message -> button text to return from confirm.
+            Title is checked first. Unmatched prompts get default.
+        default: Button returned for unmatched prompts; None means the
+            first button in the prompt.
+    """
+
+    name = 'scripted'
+
+    def __init__(self, answers: dict[str, str] | None = None, default: str | None = None):
+        self.answers = answers or {}
+        self.default = default
+
+    def alert(self, msg: str, title: str) -> None:
+        from loguru import logger
+        logger.info(f"[{title}] {msg}")
+
+    def confirm(self, msg: str, title: str, buttons: list[str]) -> str:
+        from loguru import logger
+        answer = self.answers.get(title, self.answers.get(msg))
+        if answer is None:
+            answer = self.default if self.default is not None else buttons[0]
+        logger.info(f"[{title}] {msg} -> '{answer}' (scripted)")
+        return answer.lower()
+
+
+_BACKENDS = {cls.name: cls for cls in (QtDialogs, TerminalDialogs, ScriptedDialogs)}
+_backend = None
+
+
+def set_dialog_backend(name: str, **options) -> None:
+    """Choose how prompts are shown for the rest of the process.
+
+    Args:
+        name: 'qt', 'terminal' or 'scripted'.
+        **options: Backend options; 'scripted' takes answers and default
+            (see ScriptedDialogs).
+
+    Raises:
+        ValueError: If name is not a known backend.
+    """
+
+    global _backend
+
+    if name not in _BACKENDS:
+        raise ValueError(f"unknown dialog backend '{name}'; choose from {sorted(_BACKENDS)}")
+    _backend = _BACKENDS[name](**options)
+
+
+def get_dialog_backend():
+    """Return the backend in use, creating it from UVBEKUTILS_DIALOG_BACKEND on first use."""
+
+    if _backend is None:
+        set_dialog_backend(os.environ.get("UVBEKUTILS_DIALOG_BACKEND", "qt").strip().lower() or "qt")
+    return _backend
+
+
+_requests = queue.SimpleQueue()  # (future, fn, args, kwargs) waiting for the main thread
+_pump_timer = None
+
+
+def _on_gui_thread() -> bool:
+    return threading.current_thread() is threading.main_thread()
+
+
+def _run_request(future: Future, fn, args, kwargs) -> None:
+    if not future.set_running_or_notify_cancel():
+        return  # cancelled while queued
+    try:
+        result = fn(*args, **kwargs)
+    except BaseException as e:
+        future.set_exception(e)
+        if not isinstance(e, Exception):
+            raise  # KeyboardInterrupt/SystemExit still stop the main thread
+    else:
+        future.set_result(result)
+
+
+def submit_dialog(fn, *args, **kwargs) -> Future:
+    """Run the prompt fn(*args, **kwargs) on the main thread.
+
+    From a worker thread the call is queued and a Future returned at once,
+    so the worker can carry on and collect the answer later with
+    future.result(). The main thread runs queued prompts in
+    process_dialog_requests, wait_with_dialogs or the Qt pump. Called on
+    the main thread, fn runs immediately and the Future is already done.
+
+    Returns:
+        Future holding fn's return value or exception.
+    """
+
+    future = Future()
+    if _on_gui_thread():
+        _run_request(future, fn, args, kwargs)
+    else:
+        _requests.put((future, fn, args, kwargs))
+    return future
+
+
+def gui_thread(fn):
+    """Decorator: run fn directly on the main thread, and via submit_dialog (blocking the caller) elsewhere."""
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if _on_gui_thread():
+            return fn(*args, **kwargs)
+        return submit_dialog(fn, *args, **kwargs).result()
+
+    return wrapper
+
+
+def process_dialog_requests(timeout: float = 0) -> int:
+    """Answer prompts queued by worker threads. Call on the main thread.
+
+    Args:
+        timeout: Seconds to wait for a first request if none is queued.
+
+    Returns:
+        Number of prompts answered.
+    """
+
+    count = 0
+    while True:
+        try:
+            request = _requests.get(timeout=timeout) if timeout and not count else _requests.get_nowait()
+        except queue.Empty:
+            return count
+        _run_request(*request)
+        count += 1
+
+
+def wait_with_dialogs(fs, timeout: float | None = None, poll: float = 0.05):
+    """concurrent.futures.wait(fs, timeout) that answers queued prompts while waiting.
+
+    Use on the main thread instead of blocking on pool futures, so workers
+    that prompt are not left waiting on a main thread that never shows
+    their dialog.
+
+    Returns:
+        (done, not_done) sets, as concurrent.futures.wait.
+    """
+
+    fs = list(fs)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while not all(f.done() for f in fs):
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+        process_dialog_requests(timeout=poll)
+    process_dialog_requests()
+    return futures_wait(fs, timeout=0)
+
+
+def start_dialog_pump(interval_ms: int = 50) -> None:
+    """Answer queued prompts from a QTimer, for programs running a Qt event loop.
+
+    Call once on the main thread after the QApplication exists.
+    """
+
+    global _pump_timer
+
+    from PySide6.QtCore import QTimer
+
+    if _pump_timer is None:
+        _pump_timer = QTimer()
+        _pump_timer.timeout.connect(process_dialog_requests)
+    _pump_timer.start(interval_ms)
+
+
+def alert(msg: str, title: str = "Alert") -> None:
+    """Show msg with an Ok button using the selected backend."""
+
+    get_dialog_backend().alert(msg, title)
+
+
+def confirm(msg: str, title: str = "Confirm", buttons: list[str] | None = None) -> str:
+    """Show msg with buttons using the selected backend.
+
+    Returns:
+        The lowercase text of the chosen button, or '' if the prompt was
+        dismissed without a choice.
+    """
+
+    answer = replayed_answer('confirm', title)
+    if answer is NO_ANSWER:
+        answer = get_dialog_backend().confirm(msg, title, buttons or DEFAULT_BUTTONS)
+        record_answer('confirm', title, answer, msg)
+    return answer
+
+
+NO_ANSWER = object()  # replayed_answer found nothing to replay
+_record_path = None
+_replay_answers = None  # (kind, title) -> deque of answers, in recorded order
+_replay_strict = False
+_env_checked = False
+
+
+def record_dialogs(path: str | Path) -> None:
+    """Record the answer to every later confirm/list_pick/select_file in path.
+
+    Each call starts a new session: an existing file is emptied, then
+    answers are appended to it until stop_dialog_session.
+
+    Args:
+        path: Session file (JSON Lines); created, or overwritten if it exists.
+    """
+
+    global _record_path, _env_checked
+
+    _env_checked = True
+    _record_path = Path(path).expanduser()
+    _record_path.parent.mkdir(parents=True, exist_ok=True)
+    _record_path.write_text("")  # a stale earlier run would otherwise replay first
+
+
+def replay_dialogs(path: str | Path, strict: bool = False) -> None:
+    """Answer later prompts from a session file written by record_dialogs.
+
+    Args:
+        path: Session file to replay.
+        strict: If True, a prompt with no recorded answer left raises
+            RuntimeError instead of being shown.
+    """
+
+    global _replay_answers, _replay_strict, _env_checked
+
+    _env_checked = True
+    _replay_answers = {}
+    _replay_strict = strict
+    with open(Path(path).expanduser()) as f:
+        for line in f:
+            if line.strip():
+                rec = json.loads(line)
+                _replay_answers.setdefault((rec['kind'], rec['title']), deque()).append(rec['answer'])
+
+
+def stop_dialog_session() -> None:
+    """Stop recording and replaying; prompts are shown normally again."""
+
+    global _record_path, _replay_answers, _env_checked
+
+    _env_checked = True
+    _record_path = None
+    _replay_answers = None
+
+
+def _check_env() -> None:
+    """Start recording/replaying from the environment on first use."""
+
+    global _env_checked
+
+    if _env_checked:
+        return
+    _env_checked = True
+    if os.environ.get("UVBEKUTILS_DIALOG_REPLAY"):
+        replay_dialogs(os.environ["UVBEKUTILS_DIALOG_REPLAY"])
+    if os.environ.get("UVBEKUTILS_DIALOG_RECORD"):
+        record_dialogs(os.environ["UVBEKUTILS_DIALOG_RECORD"])
+
+
+def replayed_answer(kind: str, title: str):
+    """Return the next recorded answer for this prompt, or NO_ANSWER.
+
+    Prompt functions call this before building any widgets.
+
+    Args:
+        kind: Prompt type, e.g. 'confirm', 'list_pick', 'select_file'.
+        title: Prompt title.
+    """
+
+    _check_env()
+    if _replay_answers is None:
+        return NO_ANSWER
+    answers = _replay_answers.get((kind, title))
+    if answers:
+        answer = answers.popleft()
+        from loguru import logger
+        logger.debug(f"replayed {kind} '{title}' -> {answer!r}")
+        return answer
+    if _replay_strict:
+        raise RuntimeError(f"no recorded answer left for {kind} '{title}'")
+    return NO_ANSWER
+
+
+def record_answer(kind: str, title: str, answer, msg: str | None = None) -> None:
+    """Append an answer to the session file if recording; no-op otherwise.
+
+    Args:
+        kind: Prompt type, e.g. 'confirm', 'list_pick', 'select_file'.
+        title: Prompt title.
+        answer: JSON-serializable answer the prompt returned.
+        msg: Prompt message, stored for reference only.
+    """
+
+    _check_env()
+    if _record_path is None:
+        return
+    with open(_record_path, 'a') as f:
+        f.write(json.dumps({'kind': kind, 'title': title, 'msg': msg, 'answer': answer}) + "\n")
@@ -0,0 +1,156 @@
+"""Named Excel cell styles built once from plain-data specs.
+
+A style spec is a dict of style name -> parts, each part given as data
+rather than as an openpyxl expression string::
+
+    STYLES = {
+        'title':    {'font': {'b': True, 'size': 20}},
+        'subtitle': {'font': {'size': 12, 'italic': True}},
+        'money':    {'number_format': '#,##0.00', 'alignment': {'horizontal': 'right'}},
+        'total':    {'font': {'b': True}, 'fill': {'fgColor': 'DDEBF7'},
+                     'border': {'top': {'style': 'thin'}}},
+    }
+
+``parse_style_specs`` turns the specs into openpyxl ``NamedStyle`` objects
+once; ``register_styles`` adds them to a workbook, after which any cell
+takes a style by name (``cell.style = 'title'``). Every cell using a named
+style shares one entry in the saved file instead of carrying its own copy
+of the font/fill/alignment.
+
+Functions:
+    parse_style_specs: Build NamedStyle objects from a spec dict.
+    register_styles: Add parsed styles to a workbook (skips names already there).
+    apply_style: Set a named style on every cell in a range.
+    font_from_str: Parse a 'Font(b=True, size=20)' string without eval.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+# openpyxl is imported inside each function; these names are for annotations only
+if TYPE_CHECKING:
+    from openpyxl.styles import Font, NamedStyle
+    from openpyxl.workbook import Workbook
+    from openpyxl.worksheet.worksheet import Worksheet
+
+
+def parse_style_specs(specs: dict[str, dict]) -> dict[str, NamedStyle]:
+    """Build openpyxl NamedStyle objects from plain-data style specs.
+
+    Args:
+        specs: Style name -> dict with any of these keys:
+
+            * **font** — ``Font`` keyword arguments, e.g. ``{'b': True, 'size': 14}``
+            * **fill** — ``PatternFill`` keyword arguments; ``fill_type``
+              defaults to ``'solid'`` when a color is given
+            * **alignment** — ``Alignment`` keyword arguments
+            * **border** — side name -> ``Side`` keyword arguments, e.g.
+              ``{'bottom': {'style': 'thin'}}``
+            * **number_format** — Excel number format string
+
+    Returns:
+        Style name -> NamedStyle, in spec order.
+
+    Raises:
+        ValueError: If a spec has a key not listed above.
+    """
+
+    from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+
+    allowed = {'font', 'fill', 'alignment', 'border', 'number_format'}
+    styles = {}
+    for name, spec in specs.items():
+        unknown = set(spec) - allowed
+        if unknown:
+            raise ValueError(f"style '{name}' has unknown keys {sorted(unknown)}; allowed: {sorted(allowed)}")
+        style = NamedStyle(name=name)
+        if 'font' in spec:
+            style.font = Font(**spec['font'])
+        if 'fill' in spec:
+            fill = dict(spec['fill'])
+            if 'fill_type' not in fill and any(k in fill for k in ('fgColor', 'start_color', 'bgColor')):
+                fill['fill_type'] = 'solid'
+            style.fill = PatternFill(**fill)
+        if 'alignment' in spec:
+            style.alignment = Alignment(**spec['alignment'])
+        if 'border' in spec:
+            style.border = Border(**{side: Side(**kw) for side, kw in spec['border'].items()})
+        if 'number_format' in spec:
+            style.number_format = spec['number_format']
+        styles[name] = style
+    return styles
+
+
+def register_styles(wb: Workbook, styles: dict[str, NamedStyle] | dict[str, dict]) -> None:
+    """Add named styles to a workbook so cells can refer to them by name.
+
+    Names the workbook already has are left alone, so calling this once per
+    sheet or per report is harmless.
+
+    Args:
+        wb: Workbook (normal or write-only) to register into.
+        styles: Output of parse_style_specs, or a raw spec dict to parse first.
+    """
+
+    from openpyxl.styles import NamedStyle
+
+    if styles and not all(isinstance(s, NamedStyle) for s in styles.values()):
+        styles = parse_style_specs(styles)
+    existing = set(wb.named_styles)
+    for name, style in styles.items():
+        if name not in existing:
+            wb.add_named_style(style)
+
+
+def apply_style(ws: Worksheet, style_name: str, cell_range: str) -> None:
+    """Set a registered named style on every cell in an A1-style range.
+
+    Args:
+        ws: Worksheet whose workbook has style_name registered.
+        style_name: Name of the style.
+        cell_range: Range such as 'A1:F1' or a single cell 'A1'.
+    """
+
+    cells = ws[cell_range]
+    if not isinstance(cells, tuple):
+        cells = ((cells,),)
+    elif cells and not isinstance(cells[0], tuple):
+        cells = (cells,)
+    for row in cells:
+        for cell in row:
+            cell.style = style_name
+
+
+@lru_cache(maxsize=None)
+def font_from_str(font_str: str) -> Font:
+    """Parse a 'Font(...)' expression string into a Font, without eval.
+
+    Only literal keyword arguments are accepted, e.g.
+    ``"Font(name='Arial', b=True, size=14, color='FF0000')"``. Results are
+    cached, so every cell using the same string shares one Font object.
+
+    Args:
+        font_str: The expression string used in cell_infos 'font' entries.
+
+    Returns:
+        The openpyxl Font.
+
+    Raises:
+        ValueError: If font_str is not a Font(...) call with literal keyword arguments.
+    """
+
+    import ast
+    from openpyxl.styles import Font
+
+    try:
+        call = ast.parse(font_str.strip(), mode='eval').body
+        if not (isinstance(call, ast.Call) and isinstance(call.func, ast.Name)
+                and call.func.id == 'Font' and not call.args
+                and all(kw.arg is not None for kw in call.keywords)):
+            raise ValueError
+        kwargs = {kw.arg: ast.literal_eval(kw.value) for kw in call.keywords}
+    except (SyntaxError, ValueError):
+        raise ValueError(f"font must be a Font(...) call with literal keyword arguments, got {font_str!r}")
+    return Font(**kwargs)
@@ -0,0 +1,199 @@
+"""Opt-in timing and memory instrumentation for uvbekutils hot paths.
+
+Functions decorated with ``instrumented`` (read_file_to_df,
+standardize_columns, sumby_w_totals, autosize_xls_cols, bek_write_excel)
+record wall time, the row/column count of the frame or sheet they handled,
+and optionally peak traced memory, once instrumentation is enabled. While
+disabled the decorator adds a single flag check per call.
+
+Enable from code::
+
+    from uvbekutils import enable_instrumentation
+
+    stats = enable_instrumentation()      # logs each call, summary at exit
+    ...
+    print(stats.summary())
+
+or for a whole run by setting ``UVBEKUTILS_INSTRUMENT=1`` in the environment.
+
+Memory tracking uses ``tracemalloc``, which slows every allocation while on,
+so it can be turned off with ``track_memory=False``. Nested instrumented
+calls are handled (an outer call's peak includes its inner calls), but
+memory figures are per process and not meaningful across threads.
+"""
+
+import functools
+import os
+import time
+
+_enabled = False
+_collector = None
+_to_logger = True
+_track_memory = False
+_started_tracemalloc = False  # True if enable_instrumentation started tracing, so disable may stop it
+_atexit_registered = False
+_mem_stack = []  # [start_bytes, peak_bytes] per running instrumented call
+
+
+class InstrumentCollector:
+    """Accumulates one record per instrumented call and summarizes them.
+
+    Each record is a dict with 'name', 'seconds', 'rows', 'cols' and
+    'peak_mb' (None when memory tracking is off or the size is unknown).
+    """
+
+    def __init__(self):
+        self.records = []
+
+    def add(self, record: dict) -> None:
+        self.records.append(record)
+
+    def clear(self) -> None:
+        self.records.clear()
+
+    def summary(self) -> str:
+        """Return a text table of calls, total/max time, max rows/cols and peak memory per function."""
+
+        by_name = {}
+        for rec in self.records:
+            by_name.setdefault(rec['name'], []).append(rec)
+
+        lines = [f"{'function':<28}{'calls':>7}{'total s':>10}{'max s':>9}{'max rows':>10}{'max cols':>9}{'peak MB':>9}"]
+        for name, recs in sorted(by_name.items(), key=lambda kv: -sum(r['seconds'] for r in kv[1])):
+            rows = max((r['rows'] for r in recs if r['rows'] is not None), default=None)
+            cols = max((r['cols'] for r in recs if r['cols'] is not None), default=None)
+            peak = max((r['peak_mb'] for r in recs if r['peak_mb'] is not None), default=None)
+            lines.append(f"{name:<28}{len(recs):>7}{sum(r['seconds'] for r in recs):>10.3f}"
+                         f"{max(r['seconds'] for r in recs):>9.3f}"
+                         f"{'' if rows is None else rows:>10}{'' if cols is None else cols:>9}"
+                         f"{'' if peak is None else f'{peak:.1f}':>9}")
+        return "\n".join(lines)
+
+
+def enable_instrumentation(
+    collector: InstrumentCollector | None = None,
+    to_logger: bool = True,
+    track_memory: bool = True,
+    summary_at_exit: bool = True,
+) -> InstrumentCollector:
+    """Start recording instrumented calls.
+
+    Args:
+        collector: Where to store records. A new InstrumentCollector if None.
+        to_logger: If True, log each call at DEBUG level through loguru.
+        track_memory: If True, measure peak memory with tracemalloc.
+        summary_at_exit: If True, log collector.summary() at INFO level when
+            the process exits (registered once).
+
+    Returns:
+        The collector in use.
+    """
+
+    import atexit
+    import tracemalloc
+
+    global _enabled, _collector, _to_logger, _track_memory, _started_tracemalloc, _atexit_registered
+
+    _collector = collector if collector is not None else InstrumentCollector()
+    _to_logger = to_logger
+    _track_memory = track_memory
+    if track_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracemalloc = True
+    if summary_at_exit and not _atexit_registered:
+        atexit.register(_log_summary)
+        _atexit_registered = True
+    _enabled = True
+    return _collector
+
+
+def disable_instrumentation() -> None:
+    """Stop recording; instrumented functions go back to a bare flag check.
+
+    tracemalloc is stopped only if enable_instrumentation started it; tracing
+    the caller had already started is left running.
+    """
+
+    import tracemalloc
+
+    global _enabled, _started_tracemalloc
+
+    _enabled = False
+    if _started_tracemalloc and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _started_tracemalloc = False
+
+
+def _log_summary() -> None:
+    from loguru import logger
+
+    if _collector is not None and _collector.records:
+        logger.info("uvbekutils timing summary\n" + _collector.summary())
+
+
+def _shape(obj) -> tuple[int | None, int | None]:
+    """Best-effort (rows, cols) of a DataFrame/Series or openpyxl worksheet."""
+
+    shape = getattr(obj, 'shape', None)
+    if isinstance(shape, tuple) and shape:
+        return shape[0], (shape[1] if len(shape) > 1 else 1)
+    if hasattr(obj, 'max_row') and hasattr(obj, 'max_column'):
+        return obj.max_row, obj.max_column
+    return None, None
+
+
+def instrumented(func):
+    """Decorator recording time, size and memory of func when instrumentation is on."""
+
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return func(*args, **kwargs)
+        return _run_instrumented(name, func, args, kwargs)
+
+    return wrapper
+
+
+def _run_instrumented(name, func, args, kwargs):
+    import tracemalloc
+
+    track = _track_memory and tracemalloc.is_tracing()
+    if track:
+        current, peak = tracemalloc.get_traced_memory()
+        if _mem_stack:
+            _mem_stack[-1][1] = max(_mem_stack[-1][1], peak)
+        tracemalloc.reset_peak()
+        _mem_stack.append([current, current])
+
+    start = time.perf_counter()
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        seconds = time.perf_counter() - start
+        peak_mb = None
+        if track:
+            _, peak = tracemalloc.get_traced_memory()
+            frame_start, frame_peak = _mem_stack.pop()
+            frame_peak = max(frame_peak, peak)
+            peak_mb = (frame_peak - frame_start) / 1e6
+            if _mem_stack:
+                _mem_stack[-1][1] = max(_mem_stack[-1][1], frame_peak)
+            tracemalloc.reset_peak()
+
+    rows, cols = _shape(result)
+    if rows is None and args:
+        rows, cols = _shape(args[0])
+    record = {'name': name, 'seconds': seconds, 'rows': rows, 'cols': cols, 'peak_mb': peak_mb}
+    if _collector is not None:
+        _collector.add(record)
+    if _to_logger:
+        from loguru import logger
+        logger.debug(f"{name}: {seconds:.3f}s rows={rows} cols={cols}"
+                     + (f" peak={peak_mb:.1f}MB" if peak_mb is not None else ""))
+    return result
+
+
+if os.environ.get("UVBEKUTILS_INSTRUMENT", "").strip().lower() in ("1", "true", "yes"):
+    enable_instrumentation()
@@ -1,7 +1,17 @@
+from uvbekutils.dialogs import gui_thread
 
+
+@gui_thread
 def list_pick(lst, title='', msg='', select_mode='single', pre_select=False, allow_none=False):
     """Select items from a list using checkboxes or radio buttons.
 
+    The list is a model/view list: only the rows on screen are drawn and the
+    checked state is one byte per item, so tens of thousands of items open,
+    filter, bulk select and confirm in milliseconds. Typing in the filter box
+    narrows the list to items containing the text (case-insensitive); Select
+    All and Clear All act on the items currently listed, and selections hidden
+    by the filter are kept.
+
     Args:
         lst: list of text items to select from
         title: title displayed at the top of the dialog
@@ -14,27 +24,151 @@ def list_pick(lst, title='', msg='', select_mode='single', pre_select=False, all
         list of selected values, [''] if OK with no selections (allow_none=True), or None if cancelled
     """
 
+    from uvbekutils import dialogs
+
+    replayed = dialogs.replayed_answer('list_pick', title)
+    if replayed is not dialogs.NO_ANSWER:
+        return replayed
+
+    import operator
     import sys
+    from itertools import compress, repeat
     from PySide6.QtWidgets import (
         QApplication, QDialog, QVBoxLayout, QHBoxLayout,
-        QCheckBox, QRadioButton, QButtonGroup, QPushButton,
-        QLabel, QScrollArea, QWidget, QMessageBox,
+        QPushButton, QLabel, QLineEdit, QMessageBox,
+        QAbstractItemView, QHeaderView, QTableView,
     )
-    from PySide6.QtCore import Qt
+    from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
 
     app = QApplication.instance()
     if app is None:
         app = QApplication(sys.argv)
 
+    is_multiple = select_mode == 'multiple'
+
+    class PickModel(QAbstractListModel):
+        """Checkable rows over lst. rows holds the item indexes currently listed;
+        checked holds one byte per item in lst, whether listed or not."""
+
+        def __init__(self, parent=None):
+            super().__init__(parent)
+            self.labels = [str(item) for item in lst]
+            self.lower_labels = None  # built on first filter
+            self.rows = range(len(lst))
+            self.filter_text = ''
+            self.checked = bytearray(len(lst))
+            self.single_checked = None  # index of the one checked item in single mode
+            if pre_select and lst:
+                self.set_checked(0, True)
+
+        def rowCount(self, parent=QModelIndex()):
+            return 0 if parent.isValid() else len(self.rows)
+
+        def data(self, index, role=Qt.DisplayRole):
+            if not index.isValid():
+                return None
+            i = self.rows[index.row()]
+            if role == Qt.DisplayRole:
+                return self.labels[i]
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if self.checked[i] else Qt.Unchecked
+            return None
+
+        def flags(self, index):
+            # not ItemIsUserCheckable: clicks and Space toggle through toggle_row, once
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+        def n_checked(self) -> int:
+            return self.checked.count(1)
+
+        def set_checked(self, i: int, state: bool):
+            if not is_multiple and state and self.single_checked not in (None, i):
+                self.checked[self.single_checked] = 0
+                self.refresh_item(self.single_checked)
+            self.checked[i] = 1 if state else 0
+            if not is_multiple:
+                self.single_checked = i if state else (None if self.single_checked == i else self.single_checked)
+            self.refresh_item(i)
+
+        def toggle_row(self, row: int):
+            i = self.rows[row]
+            self.set_checked(i, not self.checked[i])
+
+        def refresh_item(self, i: int):
+            row = self.row_of(i)
+            if row is not None:
+                index = self.index(row)
+                self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+
+        def row_of(self, i: int):
+            if isinstance(self.rows, range):
+                return i if i < len(self.rows) else None
+            try:
+                return self.rows.index(i)
+            except ValueError:
+                return None
+
+        def set_all(self, state: bool):
+            """Check or uncheck every listed item."""
+            if isinstance(self.rows, range):
+                self.checked = bytearray(b'\x01' if state else b'\x00') * len(lst)
+            else:
+                value = 1 if state else 0
+                for i in self.rows:
+                    self.checked[i] = value
+            if not is_multiple and not state and self.single_checked is not None \
+                    and not self.checked[self.single_checked]:
+                self.single_checked = None
+            if self.rows:
+                self.dataChanged.emit(self.index(0), self.index(len(self.rows) - 1), [Qt.CheckStateRole])
+
+        def set_filter(self, text: str):
+            """List only items whose label contains text; a longer text searches the previous result."""
+            text = text.strip().lower()
+            if self.lower_labels is None:
+                self.lower_labels = [label.lower() for label in self.labels]
+            if not text:
+                rows = range(len(lst))
+            else:
+                candidates = self.rows if self.filter_text and self.filter_text in text else range(len(lst))
+                labels = self.lower_labels if isinstance(candidates, range) else map(self.lower_labels.__getitem__, candidates)
+                rows = list(compress(candidates, map(operator.contains, labels, repeat(text))))
+            self.beginResetModel()
+            self.rows = rows
+            self.filter_text = text
+            self.endResetModel()
+
+        def selected_values(self) -> list:
+            return list(compress(lst, self.checked))
+
+    class PickView(QTableView):
+        """One-column table with fixed row heights; QListView lays out every row on each change."""
+
+        def __init__(self):
+            super().__init__()
+            self.horizontalHeader().hide()
+            self.horizontalHeader().setStretchLastSection(True)
+            self.verticalHeader().hide()
+            self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+            self.verticalHeader().setDefaultSectionSize(self.fontMetrics().height() + 6)
+            self.setShowGrid(False)
+            self.setWordWrap(False)
+            self.setSelectionBehavior(QAbstractItemView.SelectRows)
+            self.setSelectionMode(QAbstractItemView.SingleSelection)
+
+        def keyPressEvent(self, event):
+            if event.key() == Qt.Key_Space and self.currentIndex().isValid():
+                self.model().toggle_row(self.currentIndex().row())
+                return
+            super().keyPressEvent(event)
+
     class ListPickDialog(QDialog):
         def __init__(self):
             super().__init__()
             self.setWindowTitle(title)
             self.setMinimumWidth(350)
             self.result_value = None
-            self.is_multiple = select_mode == 'multiple'
-            self.item_widgets = []
-            self.radio_group = None
+            self.is_multiple = is_multiple
 
             main_layout = QVBoxLayout(self)
 
@@ -51,13 +185,25 @@ def list_pick(lst, title='', msg='', select_mode='single', pre_select=False, all
                 self.mode_status = QLabel("Only a single value allowed")
             main_layout.addWidget(self.mode_status)
 
-            # scroll area for list items
-            scroll = QScrollArea()
-            scroll.setWidgetResizable(True)
-            self.list_container = QWidget()
-            self.list_layout = QVBoxLayout(self.list_container)
-            scroll.setWidget(self.list_container)
-            main_layout.addWidget(scroll)
+            # filter box
+            self.filter_edit = QLineEdit()
+            self.filter_edit.setPlaceholderText("Filter")
+            self.filter_edit.setClearButtonEnabled(True)
+            self.filter_edit.textChanged.connect(self.on_filter)
+            main_layout.addWidget(self.filter_edit)
+
+            # list of items; only the visible rows are drawn
+            self.model = PickModel(self)
+            self.view = PickView()
+            self.view.setModel(self.model)
+            self.view.clicked.connect(lambda index: self.model.toggle_row(index.row()))
+            self.model.dataChanged.connect(self.update_count)
+            self.model.modelReset.connect(self.update_count)
+            main_layout.addWidget(self.view)
+
+            self.count_label = QLabel("")
+            main_layout.addWidget(self.count_label)
+            self.update_count()
 
             # action buttons
             btn_layout = QHBoxLayout()
@@ -77,52 +223,15 @@ def list_pick(lst, title='', msg='', select_mode='single', pre_select=False, all
             btn_layout.addWidget(cancel_btn)
             main_layout.addLayout(btn_layout)
 
-            # build the list based on select_mode
-            if self.is_multiple:
-                self.build_checkbox_list()
-            else:
-                self.build_radio_list()
-
-        def build_radio_list(self):
-            self.clear_list()
-            self.radio_group = QButtonGroup(self)
-            for i, item in enumerate(lst):
-                rb = QRadioButton(str(item))
-                if pre_select and i == 0:
-                    rb.setChecked(True)
-                self.radio_group.addButton(rb)
-                self.list_layout.addWidget(rb)
-                self.item_widgets.append(rb)
-            self.list_layout.addStretch()
-
-        def build_checkbox_list(self, selected_indices=None):
-            self.clear_list()
-            self.radio_group = None
-            if selected_indices is None:
-                selected_indices = set()
-            for i, item in enumerate(lst):
-                cb = QCheckBox(str(item))
-                if i in selected_indices:
-                    cb.setChecked(True)
-                elif pre_select and i == 0 and not selected_indices:
-                    cb.setChecked(True)
-                self.list_layout.addWidget(cb)
-                self.item_widgets.append(cb)
-            self.list_layout.addStretch()
-
-        def clear_list(self):
-            for w in self.item_widgets:
-                self.list_layout.removeWidget(w)
-                w.deleteLater()
-            self.item_widgets.clear()
-            # remove stretch if present
-            while self.list_layout.count():
-                item = self.list_layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
+        def update_count(self, *args):
+            self.count_label.setText(f"{self.model.n_checked():,} of {len(lst):,} selected"
+                                     + (f", {len(self.model.rows):,} listed" if self.model.filter_text else ""))
+
+        def on_filter(self, text):
+            self.model.set_filter(text)
 
         def on_ok(self):
-            selected = [lst[i] for i in range(len(lst)) if self.item_widgets[i].isChecked()]
+            selected = self.model.selected_values()
             if not selected and not allow_none:
                 QMessageBox.warning(self, title, "Please select at least one value.")
                 return
@@ -130,16 +239,10 @@ def list_pick(lst, title='', msg='', select_mode='single', pre_select=False, all
             self.accept()
 
         def on_select_all(self):
-            for w in self.item_widgets:
-                w.setChecked(True)
+            self.model.set_all(True)
 
         def on_clear(self):
-            if self.radio_group:
-                self.radio_group.setExclusive(False)
-            for w in self.item_widgets:
-                w.setChecked(False)
-            if self.radio_group:
-                self.radio_group.setExclusive(True)
+            self.model.set_all(False)
 
         def on_cancel(self):
             self.result_value = None
@@ -147,6 +250,7 @@ def list_pick(lst, title='', msg='', select_mode='single', pre_select=False, all
 
     dialog = ListPickDialog()
     dialog.exec()
+    dialogs.record_answer('list_pick', title, dialog.result_value, msg)
     return dialog.result_value
 
 
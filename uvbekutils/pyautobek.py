@@ -3,12 +3,20 @@
 This module provides lightweight replacements for pyautogui's dialog
 functions (``alert`` and ``confirm``) using PySide6/Qt widgets. Dialogs
 are displayed as always-on-top windows with word-wrapped messages.
+Called from a worker thread, each function hands its dialog to the main
+thread (see ``dialogs.gui_thread``) and waits there for the answer.
+
+Each dialog layout (kind of dialog plus its button labels) is built once
+and kept in a small pool; later prompts with the same layout reuse the
+widgets and only swap the title, message and link, so scripts that prompt
+per record do not pay for widget construction every time.
 
 Functions:
     alert: Display an alert dialog with an Ok button.
     alert_with_file_link: Display an alert dialog with an Ok button and a clickable file link.
     confirm: Display a confirmation dialog with custom buttons.
     confirm_with_file_link: Display a confirmation dialog with custom buttons and a clickable file link.
+    clear_dialog_pool: Delete the pooled dialogs.
 
 Example::
 
@@ -20,6 +28,7 @@ Example::
 
 import subprocess
 import sys
+from collections import OrderedDict
 from PySide6.QtWidgets import (
     QApplication,
     QDialog,
@@ -33,6 +42,8 @@ from PySide6.QtWidgets import (
 
 from PySide6.QtCore import Qt
 
+from uvbekutils.dialogs import gui_thread
+
 
 def _get_app():
     """Get existing QApplication or create one if needed."""
@@ -42,6 +53,125 @@ def _get_app():
     return app
 
 
+DIALOG_POOL_SIZE = 16  # layouts kept; the least recently used is deleted beyond this
+_dialog_pool = OrderedDict()  # (buttons, scroll, link, close_on_link_click) -> _PromptDialog
+
+
+class _PromptDialog(QDialog):
+    """Modal, always-on-top message dialog built once per layout and reused.
+
+    Args:
+        buttons: Button labels, left to right.
+        scroll: Put the message in a scroll area (confirm) rather than a plain label.
+        link: Show a clickable file link below the message.
+        close_on_link_click: Clicking the link also closes the dialog.
+    """
+
+    def __init__(self, buttons: tuple[str, ...], scroll: bool, link: bool, close_on_link_click: bool):
+        super().__init__()
+        self.setWindowFlags(self.windowFlags() | Qt.WindowStaysOnTopHint)
+        self.result_text = None
+        self.close_on_link_click = close_on_link_click
+
+        layout = QVBoxLayout()
+
+        self.scroll_area = None
+        self.label = QLabel()
+        self.label.setWordWrap(True)
+        if scroll:
+            self.label.setContentsMargins(4, 4, 4, 4)
+            self.scroll_area = QScrollArea()
+            self.scroll_area.setWidget(self.label)
+            self.scroll_area.setWidgetResizable(True)
+            self.scroll_area.setMinimumWidth(500)
+            self.scroll_area.setMaximumHeight(700)
+            layout.addWidget(self.scroll_area)
+        else:
+            layout.addWidget(self.label)
+
+        self.link_label = None
+        if link:
+            self.link_label = QLabel()
+            self.link_label.setOpenExternalLinks(False)
+            self.link_label.linkActivated.connect(self.on_link)
+            layout.addWidget(self.link_label)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+
+        def make_handler(button_text):
+            def handler():
+                self.result_text = button_text
+                self.accept()
+            return handler
+
+        self.buttons = []
+        for button_text in buttons:
+            btn = QPushButton(button_text)
+            btn.clicked.connect(make_handler(button_text))
+            button_layout.addWidget(btn)
+            self.buttons.append(btn)
+
+        button_layout.addStretch()
+        layout.addLayout(button_layout)
+
+        self.setLayout(layout)
+
+    def on_link(self, url):
+        subprocess.run(['open', url])
+        if self.close_on_link_click:
+            self.accept()
+
+    def ask(self, msg, title, filepath=None):
+        """Show with new texts and block until closed.
+
+        Returns:
+            The clicked button's text, or None if closed another way.
+        """
+        self.setWindowTitle(title)
+        self.label.setText(msg)
+        if self.link_label is not None:
+            self.link_label.setText(f'<a href="{filepath}">{filepath}</a>')
+        self.result_text = None
+        self.adjustSize()  # fit this message, not the previous one
+        if self.scroll_area is not None:
+            self.scroll_area.verticalScrollBar().setValue(0)
+        if self.buttons:
+            # Enter means the first button, as on a new dialog - not the one clicked last time
+            for btn in self.buttons:
+                btn.setDefault(False)
+            self.buttons[0].setDefault(True)
+            self.buttons[0].setFocus()
+        self.exec()
+        return self.result_text
+
+
+def _get_dialog(buttons, scroll=False, link=False, close_on_link_click=False):
+    """Return the pooled dialog for this layout, building it on first use."""
+    _get_app()
+    key = (tuple(buttons), scroll, link, close_on_link_click)
+    dialog = _dialog_pool.get(key)
+    if dialog is not None and dialog.isVisible():
+        # already showing (a prompt raised while another is open); use a one-off
+        return _PromptDialog(*key)
+    if dialog is None:
+        dialog = _dialog_pool[key] = _PromptDialog(*key)
+        while len(_dialog_pool) > DIALOG_POOL_SIZE:
+            _, old = _dialog_pool.popitem(last=False)
+            old.deleteLater()
+    else:
+        _dialog_pool.move_to_end(key)
+    return dialog
+
+
+def clear_dialog_pool():
+    """Delete the pooled dialogs; the next prompt of each layout builds a new one."""
+    while _dialog_pool:
+        _, dialog = _dialog_pool.popitem()
+        dialog.deleteLater()
+
+
+@gui_thread
 def alert(msg, title="Alert"):
     """Display an alert dialog with a message and an Ok button.
 
@@ -56,32 +186,10 @@ def alert(msg, title="Alert"):
 
         alert("File saved successfully.", "Status")
     """
-    app = _get_app()
-
-    dialog = QDialog()
-    dialog.setWindowTitle(title)
-    dialog.setWindowFlags(dialog.windowFlags() | Qt.WindowStaysOnTopHint)
-
-    layout = QVBoxLayout()
-
-    label = QLabel(msg)
-    label.setWordWrap(True)
-    layout.addWidget(label)
-
-    button_layout = QHBoxLayout()
-    button_layout.addStretch()
-
-    ok_button = QPushButton("Ok")
-    ok_button.clicked.connect(dialog.accept)
-    button_layout.addWidget(ok_button)
-
-    button_layout.addStretch()
-    layout.addLayout(button_layout)
-
-    dialog.setLayout(layout)
-    dialog.exec()
+    _get_dialog(["Ok"]).ask(msg, title)
 
 
+@gui_thread
 def alert_with_file_link(msg, filepath, title="Alert"):
     """Display an alert dialog with a message, a clickable file link, and an Ok button.
 
@@ -97,37 +205,10 @@ def alert_with_file_link(msg, filepath, title="Alert"):
 
         alert_with_file_link("Errors found.", "/output/error.pdf", "Error")
     """
-    app = _get_app()
-
-    dialog = QDialog()
-    dialog.setWindowTitle(title)
-    dialog.setWindowFlags(dialog.windowFlags() | Qt.WindowStaysOnTopHint)
-
-    layout = QVBoxLayout()
-
-    label = QLabel(msg)
-    label.setWordWrap(True)
-    layout.addWidget(label)
-
-    link_label = QLabel(f'<a href="{filepath}">{filepath}</a>')
-    link_label.setOpenExternalLinks(False)
-    link_label.linkActivated.connect(lambda url: subprocess.run(['open', url]))
-    layout.addWidget(link_label)
-
-    button_layout = QHBoxLayout()
-    button_layout.addStretch()
-
-    ok_button = QPushButton("Ok")
-    ok_button.clicked.connect(dialog.accept)
-    button_layout.addWidget(ok_button)
-
-    button_layout.addStretch()
-    layout.addLayout(button_layout)
-
-    dialog.setLayout(layout)
-    dialog.exec()
+    _get_dialog(["Ok"], link=True).ask(msg, title, filepath)
 
 
+@gui_thread
 def confirm_with_file_link(msg, filepath, title="Confirm", buttons=None, close_on_link_click=False):
     """Display a confirmation dialog with a message, a clickable file link, and custom buttons.
 
@@ -160,53 +241,11 @@ def confirm_with_file_link(msg, filepath, title="Confirm", buttons=None, close_o
     if buttons is None:
         buttons = ["Ok", "Cancel"]
 
-    app = _get_app()
-
-    dialog = QDialog()
-    dialog.setWindowTitle(title)
-    dialog.setWindowFlags(dialog.windowFlags() | Qt.WindowStaysOnTopHint)
-
-    result = [None]
-
-    layout = QVBoxLayout()
-
-    label = QLabel(msg)
-    label.setWordWrap(True)
-    layout.addWidget(label)
-
-    link_label = QLabel(f'<a href="{filepath}">{filepath}</a>')
-    link_label.setOpenExternalLinks(False)
-    if close_on_link_click:
-        link_label.linkActivated.connect(
-            lambda url: (subprocess.run(['open', url]), dialog.accept())
-        )
-    else:
-        link_label.linkActivated.connect(lambda url: subprocess.run(['open', url]))
-    layout.addWidget(link_label)
-
-    button_layout = QHBoxLayout()
-    button_layout.addStretch()
-
-    def make_handler(button_text):
-        def handler():
-            result[0] = button_text
-            dialog.accept()
-        return handler
-
-    for button_text in buttons:
-        btn = QPushButton(button_text)
-        btn.clicked.connect(make_handler(button_text))
-        button_layout.addWidget(btn)
-
-    button_layout.addStretch()
-    layout.addLayout(button_layout)
-
-    dialog.setLayout(layout)
-    dialog.exec()
-
-    return result[0].lower() if result[0] is not None else ""
+    result = _get_dialog(buttons, link=True, close_on_link_click=close_on_link_click).ask(msg, title, filepath)
+    return result.lower() if result is not None else ""
 
 
+@gui_thread
 def confirm(msg, title="Confirm", buttons=None):
     """Display a confirmation dialog with custom buttons.
 
@@ -232,50 +271,11 @@ def confirm(msg, title="Confirm", buttons=None):
     if buttons is None:
         buttons = ["Ok", "Cancel"]
 
-    app = _get_app()
-
-    dialog = QDialog()
-    dialog.setWindowTitle(title)
-    dialog.setWindowFlags(dialog.windowFlags() | Qt.WindowStaysOnTopHint)
-
-    result = [None]  # Use list to allow modification in nested function
-
-    layout = QVBoxLayout()
-
-    label = QLabel(msg)
-    label.setWordWrap(True)
-    label.setContentsMargins(4, 4, 4, 4)
-
-    scroll = QScrollArea()
-    scroll.setWidget(label)
-    scroll.setWidgetResizable(True)
-    scroll.setMinimumWidth(500)
-    scroll.setMaximumHeight(700)
-    layout.addWidget(scroll)
-
-    button_layout = QHBoxLayout()
-    button_layout.addStretch()
-
-    def make_handler(button_text):
-        def handler():
-            result[0] = button_text
-            dialog.accept()
-        return handler
-
-    for button_text in buttons:
-        btn = QPushButton(button_text)
-        btn.clicked.connect(make_handler(button_text))
-        button_layout.addWidget(btn)
-
-    button_layout.addStretch()
-    layout.addLayout(button_layout)
-
-    dialog.setLayout(layout)
-    dialog.exec()
+    result = _get_dialog(buttons, scroll=True).ask(msg, title)
 
-    # result[0] stays None when the dialog is closed with the window button
+    # result stays None when the dialog is closed with the window button
     # instead of a choice. Matches the guard in confirm_with_file_link above.
-    return result[0].lower() if result[0] is not None else ""
+    return result.lower() if result is not None else ""
 
 
 if __name__ == "__main__":
@@ -1,15 +1,32 @@
 from PySide6.QtWidgets import (
     QApplication, QDialog, QVBoxLayout, QHBoxLayout,
-    QLabel, QListWidget, QListWidgetItem, QPushButton, QCheckBox
+    QLabel, QLineEdit, QPushButton, QCheckBox, QAbstractItemView, QHeaderView,
+    QSplitter, QTableView, QTableWidget, QTableWidgetItem, QWidget
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractListModel, QFileSystemWatcher, QModelIndex, QTimer, Signal
 from PySide6.QtGui import QFontMetrics
+from dataclasses import dataclass
 from pathlib import Path
-from fnmatch import fnmatch
+from fnmatch import translate
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import compress, filterfalse, repeat
+import csv
+import operator
+from operator import attrgetter
+import os
+import queue
+import re
 import sys
+import threading
+import time
 
+from uvbekutils.dialogs import gui_thread
 
-def select_file(title: str, start_dir: str, files_like: str, choices: list[str] = ["Select", "Cancel"], mode: str = "file", title2: str = "", show_hiddenbutton: bool = False, show_sortbutton: bool = False) -> str | None:
+
+@gui_thread
+def select_file(title: str, start_dir: str, files_like: str, choices: list[str] = ["Select", "Cancel"], mode: str = "file", title2: str = "", show_hiddenbutton: bool = False, show_sortbutton: bool = False, show_preview: bool = False, preview_rows: int = 20) -> str | None:
     """
     Display a file/directory selection dialog.
 
@@ -22,34 +39,461 @@ def select_file(title: str, start_dir: str, files_like: str, choices: list[str]
         title2: Optional subtitle displayed below the window title
         show_hiddenbutton: Show checkbox to toggle hidden files (default False)
         show_sortbutton: Show checkbox to toggle sort order (default False)
+        show_preview: Show the first rows of the highlighted CSV/XLSX file beside the list (default False)
+        preview_rows: Number of rows to preview, header included (default 20)
 
     Returns:
         Selected path as string, or None if cancelled
     """
+    from uvbekutils import dialogs
+
+    replayed = dialogs.replayed_answer('select_file', title)
+    if replayed is not dialogs.NO_ANSWER:
+        return replayed
+
     # Create application if needed
     app = QApplication.instance()
     if app is None:
         app = QApplication(sys.argv)
 
-    dialog = FileSelectDialog(title, start_dir, files_like, choices, mode, title2, show_hiddenbutton, show_sortbutton)
+    dialog = FileSelectDialog(title, start_dir, files_like, choices, mode, title2, show_hiddenbutton, show_sortbutton,
+                              show_preview, preview_rows)
     result = dialog.exec()
 
-    if result == QDialog.Accepted:
-        return dialog.selected_path
-    return None
+    selected = dialog.selected_path if result == QDialog.Accepted else None
+    dialogs.record_answer('select_file', title, selected, title2)
+    return selected
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class _Entry:
+    """One listed directory entry. kind is 'parent', 'dir', 'dir_nav' or 'file'.
+
+    Compared by identity, so finding an entry in a row list is a C-speed scan.
+    """
+    kind: str
+    path: str
+    name: str
+    lname: str            # name.lower(), computed once on the scan thread
+    mtime: float = 0.0
+    hidden: bool = False
+
+
+class _DirScanner:
+    """Scans one directory on a worker thread and queues entries in batches.
+
+    Uses os.scandir, so the dir/file check comes from the directory listing
+    and each entry is stat'ed at most once. Entries that can never be shown
+    (files in dir mode, files not matching files_like) are dropped here.
+    The worker never touches Qt objects: batches go on a queue that the
+    dialog drains from a timer on the GUI thread.
+    """
+
+    BATCH_SIZE = 2000
+    BATCH_SECONDS = 0.05
+
+    def __init__(self, directory: Path, matcher, mode: str):
+        self.directory = directory
+        self.matcher = matcher
+        self.mode = mode
+        self.results = queue.SimpleQueue()  # list[_Entry] batches, then ('done', error)
+        self.cancelled = False
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def cancel(self):
+        self.cancelled = True
+        self.thread.join()
+
+    def run(self):
+        pending = []
+        last_put = time.monotonic()
+        error = ""
+        try:
+            with os.scandir(self.directory) as it:
+                for de in it:
+                    if self.cancelled:
+                        return
+                    entry = self._make_entry(de)
+                    if entry is not None:
+                        pending.append(entry)
+                    if len(pending) >= self.BATCH_SIZE or (
+                            pending and time.monotonic() - last_put >= self.BATCH_SECONDS):
+                        self.results.put(pending)
+                        pending = []
+                        last_put = time.monotonic()
+        except OSError as e:
+            error = str(e)
+        if pending:
+            self.results.put(pending)
+        self.results.put(('done', error))
+
+    def _make_entry(self, de: os.DirEntry) -> _Entry | None:
+        try:
+            is_dir = de.is_dir()
+        except OSError:
+            is_dir = False
+        lname = de.name.lower()
+        matches = self.matcher(lname) is not None
+        if is_dir:
+            # In file mode, or when not matching the wildcard, directories are for navigation only
+            kind = "dir" if self.mode == "file" or matches else "dir_nav"
+        elif self.mode != "dir" and matches:
+            kind = "file"
+        else:
+            return None
+        try:
+            mtime = de.stat().st_mtime
+        except OSError:
+            mtime = 0.0  # broken symlink or vanished file
+        return _Entry(kind, de.path, de.name, lname, mtime, de.name.startswith("."))
+
+
+_GLOB_CHARS = re.compile(r"[*?\[]")
+
+
+def _compile_filter(text: str) -> list[tuple[str, str]]:
+    """Parse filter box text into (kind, value) matchers, lowercased.
+
+    Alternatives are separated by commas or semicolons and a name matching
+    any of them is listed; spaces are part of the pattern, so 'sales 2024'
+    finds names containing that text and typing more only narrows. A
+    pattern with no wildcard is a substring search. Common glob shapes ('*.csv', 'abc*',
+    '*abc*') become plain suffix/prefix/substring tests; anything else is
+    compiled to a regex once here.
+    """
+    matchers = []
+    for pat in re.split(r"[,;]", text.lower()):
+        pat = pat.strip()
+        if not pat:
+            continue
+        if not _GLOB_CHARS.search(pat):
+            matchers.append(("in", pat))
+            continue
+        inner = pat.strip("*")
+        if inner and not _GLOB_CHARS.search(inner):
+            if pat.startswith("*") and pat.endswith("*"):
+                matchers.append(("in", inner))
+            elif pat.startswith("*"):
+                matchers.append(("suffix", inner))
+            elif pat.endswith("*"):
+                matchers.append(("prefix", inner))
+            else:
+                matchers.append(("regex", re.compile(translate(pat))))
+        else:
+            matchers.append(("regex", re.compile(translate(pat))))
+    return matchers
+
+
+def _filter_flags(matchers: list[tuple[str, str]], names: list[str]):
+    """One truth value per name: does any matcher match it. Runs at C speed via map."""
+    flags = None
+    for kind, value in matchers:
+        if kind == "in":
+            hits = map(operator.contains, names, repeat(value))
+        elif kind == "suffix":
+            hits = map(str.endswith, names, repeat(value))
+        elif kind == "prefix":
+            hits = map(str.startswith, names, repeat(value))
+        else:
+            hits = map(value.match, names)
+        flags = hits if flags is None else map(operator.or_, map(bool, flags), map(bool, hits))
+    return flags
+
+
+def _narrows(old: list[tuple[str, str]], new: list[tuple[str, str]]) -> bool:
+    """True if every name matching new also matched old (each substring only got longer)."""
+    return (len(old) == len(new)
+            and all(ok == "in" and nk == "in" and ov in nv for (ok, ov), (nk, nv) in zip(old, new)))
+
+
+class _EntryModel(QAbstractListModel):
+    """List model over the scanned entries; only visible rows are ever drawn.
+
+    all_entries holds everything scanned. ordered holds the entries passing
+    the show-hidden setting, sorted, with their lowercase names alongside in
+    ordered_names; the filter box text narrows ordered into rows, which is
+    what is shown, with the parent-directory entry always first. Filtering
+    keeps the sort order, so a keystroke never re-sorts, and a filter that
+    only extends the previous one searches the previous result. Reordering
+    goes through set_rows, which keeps the current item and selection.
+    """
+
+    filter_finished = Signal()
+
+    FILTER_CHUNK = 20000
+    DELTA_LIMIT = 2000  # apply_scan re-sorts everything above this many changes
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.all_entries = []
+        self.ordered = []
+        self.ordered_names = []
+        self.rows = []
+        self.rows_sorted = True  # False while scanned entries are appended unsorted
+        self.show_hidden = False
+        self.sort_alpha = False
+        self.matchers = []
+        self.last_filter = None  # (matchers, entries, names) of the previous filter result
+        self.pending_filter = None  # (matchers, entries, names, next start, hit entries, hit names)
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(0)
+        self.filter_timer.timeout.connect(self._filter_next_chunk)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        entry = self.rows[index.row()]
+        if entry.kind == "parent":
+            return "[..] Parent Directory"
+        if entry.kind == "dir":
+            return f"[DIR] {entry.name}"
+        if entry.kind == "dir_nav":
+            return f"[dir] {entry.name}"
+        return f"     {entry.name}"
+
+    def entry(self, row: int) -> _Entry:
+        return self.rows[row]
+
+    def reset(self, directory: Path):
+        """Start a new listing holding only the parent-directory entry."""
+        self.filter_timer.stop()
+        self.pending_filter = None
+        self.beginResetModel()
+        self.all_entries = []
+        self.ordered = []
+        self.ordered_names = []
+        self.last_filter = None
+        self.rows = [_Entry("parent", str(directory.parent), "..", "..")]
+        self.rows_sorted = True
+        self.endResetModel()
+
+    def is_visible(self, entry: _Entry) -> bool:
+        return self.show_hidden or not entry.hidden
+
+    def append_entries(self, entries: list[_Entry]):
+        """Add newly scanned entries at the end; sort_rows puts them in order."""
+        self.all_entries.extend(entries)
+        self.rows_sorted = False
+        visible = [e for e in entries if self.is_visible(e)]
+        if visible and self.matchers:
+            visible = list(compress(visible, _filter_flags(self.matchers, [e.lname for e in visible])))
+        if visible:
+            first = len(self.rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(visible) - 1)
+            self.rows.extend(visible)
+            self.endInsertRows()
+
+    def sort_key(self):
+        """Directories before files, then by name or by newest modified (then name)."""
+        if self.sort_alpha:
+            return lambda e: (e.kind == "file", e.lname)
+        return lambda e: (e.kind == "file", -e.mtime, e.lname)
+
+    def sort_rows(self):
+        """Re-filter and re-sort all scanned entries, then apply the filter text."""
+        visible = self.all_entries if self.show_hidden else list(filterfalse(attrgetter('hidden'), self.all_entries))
+        # Same order as sort_key, but sorting dirs and files apart keeps every key C-level
+        files = [e for e in visible if e.kind == "file"]
+        dirs = [e for e in visible if e.kind != "file"] if len(files) < len(visible) else []
+        for part in (dirs, files):
+            part.sort(key=attrgetter('lname'))
+            if not self.sort_alpha:
+                part.sort(key=attrgetter('mtime'), reverse=True)  # stable: same mtime stays by name
+        self.ordered = dirs + files
+        self.ordered_names = list(map(attrgetter('lname'), self.ordered))
+        self.rows_sorted = True
+        self.last_filter = None
+        self.apply_filter(self.matchers)
+
+    def apply_filter(self, matchers: list[tuple[str, str]]):
+        """Show only ordered entries matching any of matchers (all if empty).
+
+        The first FILTER_CHUNK candidates are filtered right away and the
+        rest in further chunks from the event loop, so a keystroke never
+        holds the GUI for more than about a frame. filter_finished is
+        emitted once every candidate has been checked.
+        """
+        self.matchers = matchers
+        self.filter_timer.stop()
+        self.pending_filter = None
+        if not matchers:
+            self.last_filter = None
+            self.set_rows(self.rows[:1] + self.ordered)
+            self.filter_finished.emit()
+            return
+        if self.last_filter is not None and _narrows(self.last_filter[0], matchers):
+            _, entries, names = self.last_filter
+        else:
+            entries, names = self.ordered, self.ordered_names
+        self.last_filter = None
+        self.pending_filter = (matchers, entries, names, 0, [], [])
+        self.set_rows(self.rows[:1])
+        self._filter_next_chunk()
+
+    def _filter_next_chunk(self):
+        matchers, entries, names, start, hit_entries, hit_names = self.pending_filter
+        end = start + self.FILTER_CHUNK
+        flags = list(_filter_flags(matchers, names[start:end]))
+        new_entries = list(compress(entries[start:end], flags))
+        hit_entries.extend(new_entries)
+        hit_names.extend(compress(names[start:end], flags))
+        if new_entries:
+            first = len(self.rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_entries) - 1)
+            self.rows.extend(new_entries)
+            self.endInsertRows()
+        if end < len(entries):
+            self.pending_filter = (matchers, entries, names, end, hit_entries, hit_names)
+            self.filter_timer.start()
+        else:
+            self.pending_filter = None
+            self.last_filter = (matchers, hit_entries, hit_names)
+            self.filter_finished.emit()
+
+    def apply_scan(self, entries: list[_Entry]) -> int:
+        """Bring the listing up to date with a fresh scan, touching only what changed.
+
+        Entries are matched by path; a new mtime or kind counts as a change.
+        Removed rows are taken out and added or changed ones inserted at
+        their sorted position, so the view keeps its selection and scroll
+        position. Large deltas, or one arriving mid-filter, re-sort instead.
+
+        Returns:
+            Number of added, removed and changed entries.
+        """
+        known = {e.path: e for e in self.all_entries}
+        fresh = {e.path: e for e in entries}
+        removed = [e for path, e in known.items() if path not in fresh]
+        added = []
+        changed = 0
+        for path, e in fresh.items():
+            old = known.get(path)
+            if old is None:
+                added.append(e)
+            elif old.mtime != e.mtime or old.kind != e.kind:
+                removed.append(old)
+                added.append(e)
+                changed += 1
+        count = len(removed) + len(added) - changed
+        if not count:
+            return 0
+
+        gone = set(removed)
+        self.all_entries = [e for e in self.all_entries if e not in gone] + added
+        self.last_filter = None
+        if len(removed) + len(added) > self.DELTA_LIMIT or self.pending_filter is not None:
+            self.sort_rows()
+            return count
+
+        for e in removed:
+            i = self.find(self.ordered, e)
+            if i is not None:
+                del self.ordered[i], self.ordered_names[i]
+            row = self.find(self.rows, e, lo=1)
+            if row is not None:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self.rows[row]
+                self.endRemoveRows()
+
+        key = self.sort_key()
+        for e in added:
+            if not self.is_visible(e):
+                continue
+            i = bisect_right(self.ordered, key(e), key=key)
+            self.ordered.insert(i, e)
+            self.ordered_names.insert(i, e.lname)
+            if self.matchers and not next(_filter_flags(self.matchers, [e.lname])):
+                continue
+            row = bisect_right(self.rows, key(e), lo=1, key=key)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.rows.insert(row, e)
+            self.endInsertRows()
+        return count
+
+    def set_rows(self, rows: list[_Entry]):
+        """Replace rows, moving current/selected indexes to the same entries."""
+        self.layoutAboutToBeChanged.emit()
+        old = self.persistentIndexList()
+        if old:
+            old_entries = [self.rows[i.row()] for i in old]
+            self.rows = rows
+            self.changePersistentIndexList(old, [self.index_of(e) for e in old_entries])
+        else:
+            self.rows = rows
+        self.layoutChanged.emit()
+
+    def find(self, seq: list[_Entry], entry: _Entry, lo: int = 0) -> int | None:
+        """Position of entry in seq, sorted by sort_key from lo on, by bisection; None if absent."""
+        key = self.sort_key()
+        k = key(entry)
+        i = bisect_left(seq, k, lo=lo, key=key)
+        while i < len(seq) and seq[i] is not entry and key(seq[i]) == k:
+            i += 1  # equal keys (names differing only in case)
+        return i if i < len(seq) and seq[i] is entry else None
+
+    def index_of(self, entry: _Entry) -> QModelIndex:
+        if entry.kind == "parent":
+            row = 0
+        elif self.rows_sorted:
+            row = self.find(self.rows, entry, lo=1)
+        else:
+            row = next((i for i, e in enumerate(self.rows) if e is entry), None)  # still scanning
+        return QModelIndex() if row is None else self.index(row)
+
+
+_PREVIEW_SUFFIXES = {".csv", ".xlsx", ".xlsm"}
+PREVIEW_CACHE_SIZE = 16  # previews kept per dialog
+
+
+def _read_preview(path: str, n_rows: int) -> list[list[str]]:
+    """Read the first n_rows rows of a CSV or XLSX file as strings, without loading the rest.
+
+    CSVs are read line by line; workbooks are opened read-only and only the
+    first sheet's first rows are pulled. Runs on the preview worker thread.
+    """
+    if Path(path).suffix.lower() == ".csv":
+        with open(path, newline="", encoding="utf-8-sig", errors="replace") as f:
+            return [row for _, row in zip(range(n_rows), csv.reader(f))]
+
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        return [["" if v is None else str(v) for v in row]
+                for row in ws.iter_rows(max_row=n_rows, values_only=True)]
+    finally:
+        wb.close()
 
 
 class FileSelectDialog(QDialog):
-    def __init__(self, title: str, start_dir: str, files_like: str, choices: list[str], mode: str, title2: str = "", show_hidden_button: bool = False, show_sort_button: bool = False):
+    def __init__(self, title: str, start_dir: str, files_like: str, choices: list[str], mode: str, title2: str = "", show_hidden_button: bool = False, show_sort_button: bool = False, show_preview: bool = False, preview_rows: int = 20):
         super().__init__()
         self.current_dir = Path(start_dir).expanduser().resolve()
         self.files_like = files_like if files_like.strip() else "*"
+        self.matcher = re.compile(translate(self.files_like.lower())).match
         self.mode = mode
         self.title2 = title2
         self.selected_path = None
-        self.item_paths = []
         self.show_hidden_button = show_hidden_button
         self.show_sort_button = show_sort_button
+        self.scanner = None
+        self.refreshing = False       # scanner is a watcher refresh, not a fresh listing
+        self.refresh_entries = []
+        self.refresh_pending = False  # directory changed while a scan was running
+        self.show_preview = show_preview
+        self.preview_rows = preview_rows
+        self.preview_cache = OrderedDict()  # (path, mtime_ns, size) -> rows, most recent last
+        self.preview_pool = None
+        self.preview_job = None           # (key, future) of the preview being read
+        self.preview_late = []            # (key, future) of superseded reads already running
 
         self.setWindowTitle(title)
         self.setMinimumSize(750, 400)
@@ -90,11 +534,67 @@ class FileSelectDialog(QDialog):
             self.show_hidden_cb.stateChanged.connect(self.on_hidden_toggled)
             layout.addWidget(self.show_hidden_cb)
 
-        # List widget
-        self.list_widget = QListWidget()
-        self.list_widget.itemDoubleClicked.connect(self.on_double_click)
-        self.list_widget.currentItemChanged.connect(self.on_selection_changed)
-        layout.addWidget(self.list_widget)
+        # Type-ahead filter over the scanned entries
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Filter: text or patterns; separate alternatives with commas, e.g.  sales 2024, *.xlsx")
+        self.filter_edit.setClearButtonEnabled(True)
+        self.filter_edit.textChanged.connect(self.on_filter_changed)
+        layout.addWidget(self.filter_edit)
+
+        # List over a model, so only the visible rows are ever drawn. A one-column
+        # table with fixed row heights, because QListView lays out every row on each change
+        self.model = _EntryModel(self)
+        self.list_view = QTableView()
+        self.list_view.horizontalHeader().hide()
+        self.list_view.horizontalHeader().setStretchLastSection(True)
+        self.list_view.verticalHeader().hide()
+        self.list_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.list_view.verticalHeader().setDefaultSectionSize(self.list_view.fontMetrics().height() + 6)
+        self.list_view.setShowGrid(False)
+        self.list_view.setWordWrap(False)
+        self.list_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.list_view.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.list_view.setModel(self.model)
+        self.filter_current = None
+        self.model.filter_finished.connect(self.on_filter_finished)
+        self.list_view.doubleClicked.connect(self.on_double_click)
+        self.list_view.selectionModel().currentChanged.connect(self.on_selection_changed)
+        if self.show_preview:
+            # Preview of the highlighted file, read on a worker thread
+            self.preview_table = QTableWidget()
+            self.preview_table.setEditTriggers(QTableWidget.NoEditTriggers)
+            self.preview_label = QLabel("")
+            preview_box = QWidget()
+            preview_layout = QVBoxLayout(preview_box)
+            preview_layout.setContentsMargins(0, 0, 0, 0)
+            preview_layout.addWidget(self.preview_label)
+            preview_layout.addWidget(self.preview_table)
+            splitter = QSplitter(Qt.Horizontal)
+            splitter.addWidget(self.list_view)
+            splitter.addWidget(preview_box)
+            splitter.setSizes([350, 400])
+            layout.addWidget(splitter)
+            self.preview_pool = ThreadPoolExecutor(max_workers=1)
+            self.preview_timer = QTimer(self)
+            self.preview_timer.setInterval(30)
+            self.preview_timer.timeout.connect(self.check_preview)
+        else:
+            layout.addWidget(self.list_view)
+
+        # Scan progress / error label, updated as the scan timer drains batches
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+        self.scan_timer = QTimer(self)
+        self.scan_timer.setInterval(30)
+        self.scan_timer.timeout.connect(self.drain_scan)
+
+        # Watch the listed directory; bursts of changes are collapsed into one refresh
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.on_dir_changed)
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(300)
+        self.refresh_timer.timeout.connect(self.refresh_list)
 
         # Button row
         button_layout = QHBoxLayout()
@@ -112,12 +612,29 @@ class FileSelectDialog(QDialog):
         layout.addLayout(button_layout)
 
     def on_sort_toggled(self, state):
-        """Re-populate list when sort checkbox is toggled."""
-        self.populate_list()
+        """Re-sort the scanned entries when sort checkbox is toggled."""
+        self.model.sort_alpha = self.sort_alpha_cb.isChecked()
+        self.model.sort_rows()
 
     def on_hidden_toggled(self, state):
-        """Re-populate list when show hidden checkbox is toggled."""
-        self.populate_list()
+        """Re-filter the scanned entries when show hidden checkbox is toggled."""
+        self.model.show_hidden = self.show_hidden_cb.isChecked()
+        self.model.sort_rows()
+
+    def on_filter_changed(self, text):
+        """Narrow the listed entries to those matching the filter box."""
+        current = self.list_view.currentIndex()
+        if current.isValid():
+            # Remembered across keystrokes, so it comes back when the filter widens again
+            self.filter_current = self.model.entry(current.row())
+        self.model.apply_filter(_compile_filter(text))
+
+    def on_filter_finished(self):
+        """Re-select the item that was current before filtering if it is still listed."""
+        if self.filter_current is not None and not self.list_view.currentIndex().isValid():
+            index = self.model.index_of(self.filter_current)
+            if index.isValid():
+                self.list_view.setCurrentIndex(index)
 
     def update_path_label(self):
         """Update path label with elided text and full path as tooltip."""
@@ -138,75 +655,185 @@ class FileSelectDialog(QDialog):
         self.update_path_label()
 
     def populate_list(self):
-        self.list_widget.clear()
-        self.item_paths.clear()
+        """List current_dir: show the parent entry now and stream the rest in from a worker thread."""
+        self.stop_scan()
         self.select_btn.setEnabled(False)  # Reset button state
-
         self.update_path_label()
-
-        # Add parent directory entry
-        item = QListWidgetItem("[..] Parent Directory")
-        self.list_widget.addItem(item)
-        self.item_paths.append(("parent", str(self.current_dir.parent)))
-
-        # Categorize entries
-        dirs = []
-        files = []
-        show_hidden = self.show_hidden_cb.isChecked() if self.show_hidden_cb else False
-        try:
-            for entry in self.current_dir.iterdir():
-                # Skip hidden files/dirs if checkbox unchecked
-                if not show_hidden and entry.name.startswith("."):
-                    continue
-                if entry.is_dir():
-                    dirs.append(entry)
-                elif self.mode != "dir":
-                    files.append(entry)
-        except PermissionError:
+        self.model.reset(self.current_dir)
+        self.status_label.setText("Loading...")
+
+        if self.watcher.directories():
+            self.watcher.removePaths(self.watcher.directories())
+        self.watcher.addPath(str(self.current_dir))
+        self.start_scan(refreshing=False)
+
+    def start_scan(self, refreshing: bool):
+        self.refreshing = refreshing
+        self.refresh_entries = []
+        self.scanner = _DirScanner(self.current_dir, self.matcher, self.mode)
+        self.scanner.start()
+        self.scan_timer.start()
+
+    def stop_scan(self):
+        """Stop a running scan and drop whatever it has queued."""
+        self.scan_timer.stop()
+        self.refresh_timer.stop()
+        self.refresh_pending = False
+        if self.scanner is not None:
+            self.scanner.cancel()
+            self.scanner = None
+
+    def on_dir_changed(self, path: str):
+        """Schedule a refresh; restarting the timer debounces bursts of changes."""
+        self.refresh_timer.start()
+
+    def refresh_list(self):
+        """Re-scan current_dir in the background and apply only the differences."""
+        if self.scanner is not None:
+            self.refresh_pending = True
             return
+        self.start_scan(refreshing=True)
 
-        # Sort (alphabetically if checked, by date modified if unchecked)
-        if self.sort_alpha_cb and self.sort_alpha_cb.isChecked():
-            dirs.sort(key=lambda p: p.name.lower())
-            files.sort(key=lambda p: p.name.lower())
-        else:
-            # Sort by modification time, newest first
-            dirs.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-            files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-
-        # Add directories (always show all for navigation)
-        for entry in dirs:
-            if self.mode == "file":
-                # In file mode, directories are for navigation only
-                item = QListWidgetItem(f"[DIR] {entry.name}")
-                self.list_widget.addItem(item)
-                self.item_paths.append(("dir", str(entry)))
-            elif fnmatch(entry.name.lower(), self.files_like.lower()):
-                # Directory matches wildcard - selectable
-                item = QListWidgetItem(f"[DIR] {entry.name}")
-                self.list_widget.addItem(item)
-                self.item_paths.append(("dir", str(entry)))
+    def drain_scan(self):
+        """Move queued batches into the model; sort or apply the delta once the scan is done."""
+        if self.scanner is None:
+            return
+        while True:
+            try:
+                batch = self.scanner.results.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(batch, tuple):
+                _, error = batch
+                self.scan_timer.stop()
+                self.scanner = None
+                if self.refreshing:
+                    self.apply_refresh()
+                else:
+                    self.model.sort_rows()
+                self.status_label.setText(error)
+                if self.refresh_pending:
+                    self.refresh_pending = False
+                    self.refresh_list()
+                return
+            if self.refreshing:
+                self.refresh_entries.extend(batch)
             else:
-                # Directory doesn't match wildcard - navigation only
-                item = QListWidgetItem(f"[dir] {entry.name}")
-                self.list_widget.addItem(item)
-                self.item_paths.append(("dir_nav", str(entry)))
-
-        # Add files
-        for entry in files:
-            if fnmatch(entry.name.lower(), self.files_like.lower()):
-                item = QListWidgetItem(f"     {entry.name}")
-                self.list_widget.addItem(item)
-                self.item_paths.append(("file", str(entry)))
-
-    def on_selection_changed(self, current: QListWidgetItem, previous: QListWidgetItem):
+                self.model.append_entries(batch)
+        if not self.refreshing:
+            self.status_label.setText(f"Loading... {len(self.model.all_entries):,} entries")
+
+    def apply_refresh(self):
+        """Apply a finished refresh scan to the model, keeping the current item if it was changed."""
+        current = self.list_view.currentIndex()
+        current_path = self.model.entry(current.row()).path if current.isValid() else None
+        self.model.apply_scan(self.refresh_entries)
+        self.refresh_entries = []
+        current = self.list_view.currentIndex()
+        if current_path is not None and (not current.isValid() or self.model.entry(current.row()).path != current_path):
+            # The view moves current to a neighbour when a changed entry is re-inserted
+            for row, entry in enumerate(self.model.rows):
+                if entry.path == current_path:
+                    self.list_view.setCurrentIndex(self.model.index(row))
+                    break
+
+    def done(self, result):
+        self.stop_scan()
+        if self.preview_pool is not None:
+            self.preview_timer.stop()
+            self.preview_pool.shutdown(wait=False, cancel_futures=True)
+        super().done(result)
+
+    def request_preview(self, entry: _Entry | None):
+        """Show the preview of entry from the cache, or start reading it on the worker thread.
+
+        Only the latest request matters: a queued read for an entry the user
+        has already moved past is cancelled, and one already running is kept
+        in preview_late so its result is cached, but not shown, when it ends.
+        """
+        if self.preview_job is not None:
+            if not self.preview_job[1].cancel():
+                self.preview_late.append(self.preview_job)
+                self.preview_timer.start()
+            self.preview_job = None
+        if entry is None or entry.kind != "file" or Path(entry.name).suffix.lower() not in _PREVIEW_SUFFIXES:
+            self.show_preview_rows(None, "")
+            return
+        try:
+            stat = os.stat(entry.path)
+        except OSError as e:
+            self.show_preview_rows(None, str(e))
+            return
+        key = (entry.path, stat.st_mtime_ns, stat.st_size)
+        if key in self.preview_cache:
+            self.preview_cache.move_to_end(key)
+            self.show_preview_rows(self.preview_cache[key], entry.name)
+            return
+        self.preview_label.setText(f"Loading {entry.name}...")
+        self.preview_job = (key, self.preview_pool.submit(_read_preview, entry.path, self.preview_rows))
+        self.preview_timer.start()
+
+    def check_preview(self):
+        """Show the preview once the worker has finished reading it; cache late results."""
+        still_late = []
+        for key, future in self.preview_late:
+            if not future.done():
+                still_late.append((key, future))
+            elif not future.cancelled() and future.exception() is None:
+                self.cache_preview(key, future.result())
+        self.preview_late = still_late
+        if self.preview_job is None or not self.preview_job[1].done():
+            if self.preview_job is None and not self.preview_late:
+                self.preview_timer.stop()
+            return
+        key, future = self.preview_job
+        self.preview_job = None
+        if not self.preview_late:
+            self.preview_timer.stop()
+        if future.cancelled():
+            return
+        try:
+            rows = future.result()
+        except Exception as e:  # unreadable or malformed file - report it in the pane
+            self.show_preview_rows(None, f"No preview: {e}")
+            return
+        self.cache_preview(key, rows)
+        self.show_preview_rows(rows, Path(key[0]).name)
+
+    def cache_preview(self, key: tuple, rows: list[list[str]]):
+        self.preview_cache[key] = rows
+        self.preview_cache.move_to_end(key)
+        while len(self.preview_cache) > PREVIEW_CACHE_SIZE:
+            self.preview_cache.popitem(last=False)
+
+    def show_preview_rows(self, rows: list[list[str]] | None, label: str):
+        """Fill the preview table, using the first row as column headers."""
+        self.preview_label.setText(label)
+        self.preview_table.clear()
+        if not rows:
+            self.preview_table.setRowCount(0)
+            self.preview_table.setColumnCount(0)
+            return
+        header, body = rows[0], rows[1:]
+        n_cols = max(len(r) for r in rows)
+        self.preview_table.setColumnCount(n_cols)
+        self.preview_table.setRowCount(len(body))
+        self.preview_table.setHorizontalHeaderLabels(header + [""] * (n_cols - len(header)))
+        for r, row in enumerate(body):
+            for c, value in enumerate(row):
+                self.preview_table.setItem(r, c, QTableWidgetItem(value))
+        self.preview_table.resizeColumnsToContents()
+
+    def on_selection_changed(self, current: QModelIndex, previous: QModelIndex):
         """Enable/disable Select button based on whether current selection is valid."""
-        if current is None:
+        if self.show_preview:
+            self.request_preview(self.model.entry(current.row()) if current.isValid() else None)
+
+        if not current.isValid():
             self.select_btn.setEnabled(False)
             return
 
-        idx = self.list_widget.row(current)
-        item_type, path = self.item_paths[idx]
+        item_type = self.model.entry(current.row()).kind
 
         # Determine if this item is selectable
         is_selectable = False
@@ -217,9 +844,9 @@ class FileSelectDialog(QDialog):
 
         self.select_btn.setEnabled(is_selectable)
 
-    def on_double_click(self, item: QListWidgetItem):
-        idx = self.list_widget.row(item)
-        item_type, path = self.item_paths[idx]
+    def on_double_click(self, index: QModelIndex):
+        entry = self.model.entry(index.row())
+        item_type, path = entry.kind, entry.path
 
         if item_type == "parent":
             self.current_dir = Path(path)
@@ -233,14 +860,14 @@ class FileSelectDialog(QDialog):
             self.accept()
 
     def on_select(self):
-        current_item = self.list_widget.currentItem()
-        if current_item is None:
+        current = self.list_view.currentIndex()
+        if not current.isValid():
             self.selected_path = None
             self.reject()
             return
 
-        idx = self.list_widget.row(current_item)
-        item_type, path = self.item_paths[idx]
+        entry = self.model.entry(current.row())
+        item_type, path = entry.kind, entry.path
 
         if item_type == "parent":
             self.selected_path = None
@@ -1,8 +1,17 @@
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from pathlib import Path
 from typing import Literal
 
 import pandas as pd
-from .bek_funcs import exit_yes
+from .bek_funcs import convert_bool_series, exit_yes, read_file_to_df
+from .instrument import instrumented
+
+
+# dtype names ColSpec accepts besides any plain pandas/numpy dtype string
+_DATETIME_DTYPES = ("datetime", "datetime64[ns]")
+_BOOL_TRUE = ("true", "t", "yes", "y", "1")
+_BOOL_FALSE = ("false", "f", "no", "n", "0")
 
 
 @dataclass
@@ -10,19 +19,52 @@ class ColSpec:
     col_name: str
     new_col_name: str | None = None
     remove_col: bool = False
+    dtype: str | None = None
+    date_format: str | None = None
 
     def __post_init__(self):
         self.col_name = self.col_name.strip()
 
 
+def _coerce_column(s: pd.Series, dtype: str, date_format: str | None = None) -> pd.Series:
+    """Convert one column to ``dtype`` in a single vectorized call.
+
+    Values that cannot be converted become missing rather than raising;
+    the caller compares null masks before and after to find them.
+    """
+    if dtype == "category":
+        return s.astype("category")
+    if dtype in _DATETIME_DTYPES:
+        return pd.to_datetime(s, format=date_format, errors="coerce")
+    import numpy as np
+
+    target = pd.api.types.pandas_dtype(dtype)
+    if pd.api.types.is_bool_dtype(target):
+        # 'bool' too: nullable, so unrecognized values can be missing
+        return convert_bool_series(s, _BOOL_TRUE, _BOOL_FALSE, errors="coerce")
+    if pd.api.types.is_numeric_dtype(target):
+        num = pd.to_numeric(s, errors="coerce")
+        if pd.api.types.is_integer_dtype(target):
+            np_int = np.dtype(getattr(target, "numpy_dtype", target))
+            info = np.iinfo(np_int)
+            # 1.5 can't become Int32, nor 300 Int8 - treat as failures
+            num = num.mask((num % 1 != 0) | (num < info.min) | (num > info.max))
+            # 'int32' -> 'Int32': a numpy int column can't hold the missing values
+            target = f"{'UInt' if np_int.kind == 'u' else 'Int'}{np_int.itemsize * 8}"
+        return num.astype(target)
+    return s.astype(dtype)
+
+
+@instrumented
 def standardize_columns(
         df: pd.DataFrame,
         col_list: list[ColSpec],
         col_check: Literal["exact", "subset"] | None = None,
         change_case: Literal['upper', 'lower'] | None = None,
         popup: bool = False,
+        coerce_errors: Literal['coerce', 'raise'] = 'coerce',
 ) -> pd.DataFrame:
-    """Renames, case-converts, and/or drops DataFrame columns from a spec list.
+    """Renames, case-converts, drops and/or retypes DataFrame columns from a spec list.
 
     Args:
         df (pd.DataFrame): Input DataFrame.
@@ -34,6 +76,17 @@ def standardize_columns(
               Rename target. ``None`` or ``''`` keeps the original name.
             * **remove_col** *(bool, optional, default* ``False`` *)* —
               ``True`` drops the column; rename is skipped.
+            * **dtype** *(str | None, optional)* —
+              Target dtype. ``'category'``, ``'boolean'`` (true/false,
+              yes/no, y/n, t/f, 1/0 in any case), ``'datetime'``, or any
+              pandas dtype string such as ``'Int32'``, ``'float32'`` or
+              ``'string'``. ``'bool'`` is read as ``'boolean'`` and numpy
+              int dtypes (``'int32'``, ``'uint8'``) give their nullable
+              counterparts (``'Int32'``, ``'UInt8'``), so failed values
+              can be missing. Values outside an int dtype's range fail.
+              ``None`` leaves the column as read.
+            * **date_format** *(str | None, optional)* —
+              ``strftime`` format used when ``dtype='datetime'``.
 
             All column name matching is case-insensitive.
         col_check (str | None, optional): Column presence validation applied
@@ -59,15 +112,32 @@ def standardize_columns(
               mismatch, then raises an exception.
             * ``False`` — raises ``ValueError`` directly with no popup.
 
+        coerce_errors (str, optional): What to do with values that fail a
+            ``dtype`` conversion. Allowed values:
+
+            * ``'coerce'`` — set them to missing (default)
+            * ``'raise'``  — fail the same way a ``col_check`` violation does
+
+            Either way the failures are logged and recorded in
+            ``result.attrs['coerce_failures']`` as a dict of column name →
+            list of index labels that failed.
+
     Returns:
         pd.DataFrame: New DataFrame with columns standardized per the spec.
             The original ``df`` is not modified.
 
     Raises:
-        ValueError: If ``col_check`` constraints are violated and ``popup=False``.
-        Exception: If ``col_check`` constraints are violated and ``popup=True``
-            (raised by ``exit_yes`` after showing a GUI popup).
+        ValueError: If ``col_check`` constraints are violated, or a dtype
+            conversion fails with ``coerce_errors='raise'``, and ``popup=False``.
+            Also if ``coerce_errors`` is not ``'coerce'`` or ``'raise'``.
+        Exception: Same conditions with ``popup=True`` (raised by ``exit_yes``
+            after showing a GUI popup).
     """
+    from loguru import logger
+
+    if coerce_errors not in ('coerce', 'raise'):
+        raise ValueError(f"coerce_errors must be 'coerce' or 'raise', got {coerce_errors!r}")
+
     # Case-insensitive map: lowercase col name → actual col name in df
     df_col_map = {col.strip().lower(): col for col in df.columns}
 
@@ -101,6 +171,7 @@ def standardize_columns(
     df = df.copy()
     rename_map = {}
     cols_to_drop = []
+    dtype_map = {}  # actual col name -> ColSpec carrying a dtype
 
     for item in col_list:
         actual = df_col_map.get(item.col_name.lower())
@@ -111,6 +182,9 @@ def standardize_columns(
             cols_to_drop.append(actual)
             continue
 
+        if item.dtype:
+            dtype_map[actual] = item
+
         target = item.new_col_name if item.new_col_name else actual
         if change_case == 'upper':
             target = target.upper()
@@ -133,4 +207,127 @@ def standardize_columns(
     if cols_to_drop:
         df = df.drop(columns=cols_to_drop)
 
+    # Each typed column is converted with one vectorized call and swapped in whole
+    converted = {}
+    failures = {}
+    fail_lines = []
+    for actual, item in dtype_map.items():
+        col = rename_map.get(actual, actual)
+        before = df[col]
+        after = _coerce_column(before, item.dtype, item.date_format)
+        failed = (after.isna() & before.notna()).to_numpy()
+        if failed.any():
+            failures[col] = df.index[failed].tolist()
+            fail_lines.append(f"  {col} -> {item.dtype}: {failed.sum()} value(s), "
+                              f"first at {failures[col][:5]}")
+        converted[col] = after
+
+    if failures:
+        msg = "dtype conversion failed in standardize_columns.\n\n" + "\n".join(fail_lines)
+        if coerce_errors == 'raise':
+            _fail(msg)
+        logger.warning(msg)
+
+    for col, values in converted.items():
+        df[col] = values
+    df.attrs['coerce_failures'] = failures
+
     return df
+
+
+def _null_column(n: int, template: pd.Series | None, dtype: str | None) -> pd.Series:
+    """Return ``n`` missing values typed like ``template`` or ``dtype``."""
+    if template is not None:
+        # empty slice + reindex keeps extension dtypes (Int32, category, boolean)
+        # and upcasts the rest the way pandas normally fills missing values
+        return template.iloc[:0].reindex(pd.RangeIndex(n))
+    nulls = pd.Series([None] * n, dtype=object)
+    # same dtype mapping as data read from a file ('bool' -> 'boolean', 'int32' -> 'Int32')
+    return _coerce_column(nulls, dtype) if dtype else nulls
+
+
+def standardize_and_union(
+        frames_or_paths: Iterable[pd.DataFrame | Path | str],
+        schema: list[ColSpec],
+        change_case: Literal['upper', 'lower'] | None = None,
+        popup: bool = False,
+        coerce_errors: Literal['coerce', 'raise'] = 'coerce',
+        **read_kwargs,
+) -> pd.DataFrame:
+    """Standardize many DataFrames or files to one schema and stack them.
+
+    Each input goes through ``standardize_columns`` with ``schema``. Output
+    columns are the non-removed specs in ``schema`` order, named
+    ``new_col_name`` (or ``col_name`` if no rename). Input columns not in
+    the schema are dropped; schema columns missing from an input are filled
+    with nulls of the column's dtype.
+
+    The result is built with one concatenation per column, so no input is
+    reindexed or copied into an intermediate frame. Categorical columns are
+    merged with ``union_categoricals`` so they stay categorical.
+
+    Args:
+        frames_or_paths: DataFrames and/or paths to ``.xlsx``/``.csv`` files,
+            in output order. Paths are read with ``read_file_to_df``.
+        schema: Column specifications; see ``standardize_columns``.
+        change_case: Passed to ``standardize_columns``.
+        popup: Passed to ``standardize_columns``.
+        coerce_errors: Passed to ``standardize_columns``.
+        **read_kwargs: Passed to ``read_file_to_df`` for path inputs.
+
+    Returns:
+        pd.DataFrame: All inputs stacked in order with a fresh RangeIndex.
+
+    Raises:
+        ValueError: As ``standardize_columns``; an invalid ``coerce_errors``
+            is rejected before any input is read.
+    """
+    from loguru import logger
+    from pandas.api.types import union_categoricals
+
+    if coerce_errors not in ('coerce', 'raise'):
+        raise ValueError(f"coerce_errors must be 'coerce' or 'raise', got {coerce_errors!r}")
+
+    # Pin every kept column to its schema spelling so vintages that differ only
+    # in case ('Name' vs 'NAME') land in the same output column
+    specs = [replace(item, new_col_name=item.new_col_name or item.col_name) for item in schema]
+    targets = []
+    target_dtypes = {}
+    for item in specs:
+        if item.remove_col:
+            continue
+        name = item.new_col_name
+        if change_case == 'upper':
+            name = name.upper()
+        elif change_case == 'lower':
+            name = name.lower()
+        targets.append(name)
+        target_dtypes[name] = item.dtype
+
+    pieces = {col: [] for col in targets}
+    lengths = []
+    for src in frames_or_paths:
+        if isinstance(src, pd.DataFrame):
+            df = src
+        else:
+            df = read_file_to_df(Path(src), **read_kwargs)
+        df = standardize_columns(df, specs, change_case=change_case, popup=popup,
+                                 coerce_errors=coerce_errors)
+        lengths.append(len(df))
+        for col in targets:
+            pieces[col].append(df[col].reset_index(drop=True) if col in df.columns else None)
+
+    columns = {}
+    for col in targets:
+        template = next((p for p in pieces[col] if p is not None), None)
+        parts = [p if p is not None else _null_column(n, template, target_dtypes[col])
+                 for p, n in zip(pieces[col], lengths)]
+        if not parts:
+            columns[col] = _null_column(0, None, target_dtypes[col])
+        elif all(isinstance(p.dtype, pd.CategoricalDtype) for p in parts):
+            columns[col] = pd.Series(union_categoricals(parts, ignore_order=True))
+        else:
+            columns[col] = pd.concat(parts, ignore_index=True)
+
+    logger.debug(f"standardize_and_union stacked {len(lengths)} inputs, {sum(lengths)} rows")
+    return pd.DataFrame(columns, columns=targets)
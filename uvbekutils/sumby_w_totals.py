@@ -11,9 +11,22 @@ Now with git, generic name that replaces those with version numbers.
 
 # TODO Is all the code below the if __file__ ok?  Especially the imports?  Is this how testing works?
 
+from .instrument import instrumented
+
 # format of INDEX_VARS_W_SUMFLAG is list of tuples: (variable name, whether to subtotal)
 # Order of variables is order/level of subtotaling
 
+# vlue to represent totalled lines; must have special char prefix to sort correctly
+TOTAL_STR = '_TOTAL'
+
+# named styles write_sumby_w_totals applies to total rows; pass styles= to override
+SUMBY_STYLES = {
+    'sumby_subtotal': {'font': {'b': True}},
+    'sumby_grand_total': {'font': {'b': True}, 'fill': {'fgColor': 'DDEBF7'},
+                          'border': {'top': {'style': 'thin'}}},
+}
+
+@instrumented
 def sumby_w_totals(df_in: "pd.DataFrame", index_vars_w_sumflag: list, summed_fields: list, agg_type: str) -> "pd.DataFrame":
     """Aggregate a DataFrame by multiple grouping variables with subtotals.
 
@@ -41,8 +54,6 @@ def sumby_w_totals(df_in: "pd.DataFrame", index_vars_w_sumflag: list, summed_fie
     from loguru import logger
 
     logger.info("Just go into sumby_w_totals")
-    # vlue to represent totalled lines; must have special char prefix to sort correctly
-    TOTAL_STR = '_TOTAL'
 
     # index_vars_w_sumflag = [('Parent Campaign', True), 'Child Organization', ('Name', True)]
     # index_vars_w_sumflag = [('Factory', False), ('Name', True)]
@@ -173,6 +184,74 @@ def sumby_w_totals(df_in: "pd.DataFrame", index_vars_w_sumflag: list, summed_fie
     return df_out
 
 
+def write_sumby_w_totals(
+        df_out: "pd.DataFrame",
+        op_file: "Path",
+        sheet_name: str = "Summary Report",
+        startrow: int = 0,
+        cell_infos: list | None = None,
+        styles: dict[str, dict] | None = None,
+) -> "Path":
+    """Write sumby_w_totals output to a styled, outlined Excel sheet in one streaming pass.
+
+    Total rows are found from the index in one vectorized comparison per
+    level. Subtotal and grand total rows get the shared named styles
+    'sumby_subtotal' and 'sumby_grand_total', and every row gets an Excel
+    outline level from its depth: detail rows sit deepest, a subtotal with
+    k leading non-total fields sits at level k, the grand total at level 0.
+    Excel's outline buttons then collapse the report to any subtotal depth.
+
+    Args:
+        df_out: DataFrame returned by sumby_w_totals.
+        op_file: Output .xlsx path.
+        sheet_name: Worksheet name.
+        startrow: Row index (0-based) where the header is written; rows above
+            are free for title cells.
+        cell_infos: Title cell-attribute dicts for rows 1..startrow. See
+            bek_excel_titles for format details.
+        styles: Named style specs merged over SUMBY_STYLES; may also define
+            styles used in cell_infos.
+
+    Returns:
+        op_file as a Path.
+    """
+
+    from pathlib import Path
+    import numpy as np
+    from loguru import logger
+    from openpyxl import Workbook
+    from uvbekutils.bek_funcs import _write_df_streaming
+    from uvbekutils.excel_styles import register_styles
+
+    op_file = Path(op_file)
+    index = df_out.index
+    n_levels = index.nlevels
+
+    # (rows x levels) mask of '_TOTAL' cells, built one level at a time
+    is_total = np.column_stack([np.asarray(index.get_level_values(level) == TOTAL_STR)
+                                for level in range(n_levels)])
+    n_total = is_total.sum(axis=1)
+
+    row_styles = np.full(len(df_out), None, dtype=object)
+    row_styles[n_total > 0] = 'sumby_subtotal'
+    row_styles[n_total == n_levels] = 'sumby_grand_total'
+    # outline depth = leading non-total fields: the first '_TOTAL' per row, or
+    # every level for detail rows, so a cross total ('_TOTAL', 'x') is level 0
+    leading = np.where(is_total.any(axis=1), is_total.argmax(axis=1), n_levels)
+    # Excel allows outline levels 0-7
+    row_levels = np.minimum(leading, 7)
+
+    wb = Workbook(write_only=True)
+    register_styles(wb, {**SUMBY_STYLES, **(styles or {})})
+    ws = wb.create_sheet(sheet_name)
+    _write_df_streaming(ws, df_out, startrow, cell_infos,
+                        row_styles=row_styles.tolist(), row_outline_levels=row_levels.tolist())
+    wb.save(op_file)
+
+    logger.info(f"wrote {len(df_out)} rows ({int((n_total > 0).sum())} totals) to '{op_file}'")
+    return op_file
+
+
 if __name__ == '__main__':
 
     from bekutils import setup_loguru
@@ -0,0 +1,294 @@
+"""Read-only viewer for text files too large to load into a widget.
+
+``scroll_box(path=...)`` opens a file here instead of pushing its text into
+a QTextEdit. The file is memory-mapped, line start offsets are found a chunk
+at a time (numpy scans each chunk for newlines), and the view asks the
+model only for the lines on screen, so a multi-hundred-MB log opens at once
+and uses memory for the offset index only (8 bytes per line).
+
+With follow on, the file is re-checked twice a second and new lines are
+appended and scrolled to, like ``tail -f``. A file that shrinks (truncated)
+or is replaced by a new file at the same path (``setup_loguru`` recreating
+the log on a new run, or rotation) is re-read from the start.
+
+Classes:
+    TextFileViewer: Window showing one file, with search and tail-follow.
+"""
+
+import mmap
+import os
+import re
+from pathlib import Path
+
+import numpy as np
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QTimer
+from PySide6.QtGui import QFontDatabase
+from PySide6.QtWidgets import (
+    QAbstractItemView, QCheckBox, QHBoxLayout, QHeaderView, QLabel, QLineEdit,
+    QMainWindow, QPushButton, QTableView, QVBoxLayout, QWidget,
+)
+
+
+class _LineIndexModel(QAbstractListModel):
+    """One row per line of a memory-mapped file, decoded only when drawn.
+
+    starts holds the byte offset where each known line begins; indexed_to
+    is how far the file has been scanned for newlines. Until the scan
+    reaches the end, only lines known to be complete are rows.
+    """
+
+    CHUNK = 16 * 1024 * 1024
+    MAX_LINE_CHARS = 10_000  # longer lines are cut for display
+
+    def __init__(self, path: Path, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.file = None
+        self.mm = None
+        self.size = 0
+        self.file_id = None  # (st_dev, st_ino) of the open file, to notice a replaced file
+        self.starts = np.zeros(1, dtype=np.int64)
+        self.indexed_to = 0
+        self.open()
+
+    # mapping ---------------------------------------------------------------
+
+    def open(self):
+        """(Re)map the file from the start and forget the index."""
+        self.close()
+        self.file = open(self.path, 'rb')
+        st = os.fstat(self.file.fileno())
+        self.size = st.st_size
+        self.file_id = (st.st_dev, st.st_ino)
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        self.starts = np.zeros(1, dtype=np.int64)
+        self.indexed_to = 0
+
+    def close(self):
+        if self.mm is not None:
+            self.mm.close()
+            self.mm = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def remap(self, size: int):
+        """Map a grown file; the index so far stays valid."""
+        if self.mm is not None:
+            self.mm.close()
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.size = size
+
+    # rows ------------------------------------------------------------------
+
+    def _row_count(self, starts, indexed_to, size) -> int:
+        if indexed_to < size or starts[-1] >= size:
+            return len(starts) - 1  # complete lines only / file ends with a newline
+        return len(starts)          # plus a last line without a newline
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count(self.starts, self.indexed_to, self.size)
+
+    def line_bytes(self, row: int) -> bytes:
+        start = int(self.starts[row])
+        end = int(self.starts[row + 1]) - 1 if row + 1 < len(self.starts) else self.size
+        return self.mm[start:end]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        text = self.line_bytes(index.row()).decode('utf-8', errors='replace').rstrip('\r')
+        return text if len(text) <= self.MAX_LINE_CHARS else text[:self.MAX_LINE_CHARS] + ' ...'
+
+    # indexing --------------------------------------------------------------
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.indexed_to < self.size
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Find the newlines in the next chunk and add the lines they complete."""
+        if parent.isValid() or self.indexed_to >= self.size:
+            return
+        start, end = self.indexed_to, min(self.indexed_to + self.CHUNK, self.size)
+        view = np.frombuffer(self.mm, dtype=np.uint8, count=end - start, offset=start)
+        newlines = np.flatnonzero(view == 10)
+        del view  # release the buffer so the mmap can be closed or remapped later
+        starts = np.concatenate((self.starts, newlines + (start + 1))) if len(newlines) else self.starts
+        self._set_index(starts, end)
+
+    def fetch_to(self, offset: int):
+        """Index at least up to byte offset."""
+        while self.indexed_to <= offset and self.canFetchMore():
+            self.fetchMore()
+
+    def _set_index(self, starts, indexed_to: int):
+        old_rows = self.rowCount()
+        new_rows = self._row_count(starts, indexed_to, self.size)
+        if new_rows > old_rows:
+            self.beginInsertRows(QModelIndex(), old_rows, new_rows - 1)
+            self.starts, self.indexed_to = starts, indexed_to
+            self.endInsertRows()
+        else:
+            self.starts, self.indexed_to = starts, indexed_to
+
+    def check_file(self) -> bool:
+        """Pick up growth (map the new bytes), or truncation or replacement (start over).
+
+        Returns True if anything changed.
+        """
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return False
+        size = st.st_size
+        replaced = (st.st_dev, st.st_ino) != self.file_id
+        if size == self.size and not replaced:
+            return False
+        if replaced or size < self.size or self.mm is None:
+            self.beginResetModel()
+            self.open()
+            self.endResetModel()
+            return True
+        complete = len(self.starts) - 1
+        if self.rowCount() > complete:
+            # the unterminated last line may continue in the new bytes; fetchMore adds it back
+            self.beginRemoveRows(QModelIndex(), complete, complete)
+            self.remap(size)
+            self.endRemoveRows()
+        else:
+            self.remap(size)
+        return True
+
+    # search ----------------------------------------------------------------
+
+    def find(self, pattern: re.Pattern, from_row: int) -> int | None:
+        """Row of the first match at or after from_row, wrapping to the top; None if absent."""
+        if self.mm is None:
+            return None
+        start = int(self.starts[from_row]) if from_row < len(self.starts) else 0
+        match = pattern.search(self.mm, start) or pattern.search(self.mm, 0, start)
+        if match is None:
+            return None
+        self.fetch_to(match.start())
+        return int(np.searchsorted(self.starts, match.start(), side='right')) - 1
+
+
+class TextFileViewer(QMainWindow):
+    """Window showing a text file through _LineIndexModel, with search and tail-follow.
+
+    Args:
+        path: File to show.
+        title: Window title; the file name if None.
+        follow: Start with tail-follow on (jump to and track the end).
+        width: Initial window width in pixels.
+        height: Initial window height in pixels.
+    """
+
+    def __init__(self, path: str | Path, title: str | None = None, follow: bool = False,
+                 width: int = 900, height: int = 600):
+        super().__init__()
+        self.path = Path(path).expanduser()
+        self.setWindowTitle(title or self.path.name)
+
+        self.model = _LineIndexModel(self.path, self)
+
+        central = QWidget()
+        layout = QVBoxLayout(central)
+
+        # Search row
+        search_row = QHBoxLayout()
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Search (case-insensitive)")
+        self.search_edit.returnPressed.connect(self.on_find)
+        find_btn = QPushButton("Find next")
+        find_btn.clicked.connect(self.on_find)
+        self.follow_cb = QCheckBox("Follow")
+        self.follow_cb.setChecked(follow)
+        self.follow_cb.toggled.connect(self.on_follow_toggled)
+        search_row.addWidget(self.search_edit)
+        search_row.addWidget(find_btn)
+        search_row.addWidget(self.follow_cb)
+        layout.addLayout(search_row)
+
+        # Lines; only those on screen are decoded and drawn. A one-column table
+        # with fixed row heights, because QListView lays out every row on each change
+        self.view = QTableView()
+        self.view.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self.view.horizontalHeader().hide()
+        self.view.horizontalHeader().setStretchLastSection(True)
+        self.view.verticalHeader().hide()
+        self.view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.view.verticalHeader().setDefaultSectionSize(self.view.fontMetrics().height() + 2)
+        self.view.setShowGrid(False)
+        self.view.setWordWrap(False)
+        self.view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.view.setModel(self.model)
+        layout.addWidget(self.view)
+
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+
+        self.setCentralWidget(central)
+        self.resize(width, height)
+
+        # Index the rest of the file a chunk per tick so the window stays live
+        self.index_timer = QTimer(self)
+        self.index_timer.setInterval(0)
+        self.index_timer.timeout.connect(self.index_step)
+        self.index_timer.start()
+
+        # Re-check the file for growth while following
+        self.follow_timer = QTimer(self)
+        self.follow_timer.setInterval(500)
+        self.follow_timer.timeout.connect(self.on_follow_tick)
+        if follow:
+            self.follow_timer.start()
+        self.update_status()
+
+    def index_step(self):
+        if self.model.canFetchMore():
+            self.model.fetchMore()
+        else:
+            self.index_timer.stop()
+            if self.follow_cb.isChecked():
+                self.view.scrollToBottom()
+        self.update_status()
+
+    def update_status(self):
+        done = self.model.indexed_to >= self.model.size
+        self.status_label.setText(f"{self.model.rowCount():,} lines, {self.model.size / 1e6:,.1f} MB"
+                                  + ("" if done else f" (indexing {self.model.indexed_to / max(self.model.size, 1):.0%})"))
+
+    def on_follow_toggled(self, checked: bool):
+        if checked:
+            self.follow_timer.start()
+            self.on_follow_tick()
+            if not self.index_timer.isActive():
+                self.view.scrollToBottom()
+        else:
+            self.follow_timer.stop()
+
+    def on_follow_tick(self):
+        if self.model.check_file() and not self.index_timer.isActive():
+            self.index_timer.start()  # indexes the new lines, then scrolls to the bottom
+
+    def on_find(self):
+        text = self.search_edit.text()
+        if not text:
+            return
+        pattern = re.compile(re.escape(text.encode('utf-8')), re.IGNORECASE)
+        current = self.view.currentIndex()
+        row = self.model.find(pattern, current.row() + 1 if current.isValid() else 0)
+        if row is None:
+            self.status_label.setText(f"'{text}' not found")
+            return
+        self.follow_cb.setChecked(False)  # a search result should not be scrolled away
+        index = self.model.index(row)
+        self.view.setCurrentIndex(index)
+        self.view.scrollTo(index, QAbstractItemView.PositionAtCenter)
+
+    def closeEvent(self, event):
+        self.index_timer.stop()
+        self.follow_timer.stop()
+        self.model.close()
+        super().closeEvent(event)